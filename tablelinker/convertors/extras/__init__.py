@@ -7,12 +7,22 @@ from tablelinker.core.convertors import Convertor, register_convertor
 
 
 __all__ = []
+_registered = False  # 登録済みかどうか
 
 
 def register():
     """
     このディレクトリにある全てのモジュールをインポートします。
+
+    Notes
+    -----
+    2 回目以降の呼び出しでは何もしません。
     """
+    global _registered
+
+    if _registered:
+        return
+
     modules = glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))
     for f in modules:
         if os.path.isfile(f) and not f.endswith('__init__.py'):
@@ -33,3 +43,5 @@ def register():
 
             if issubclass(c, Convertor):
                 register_convertor(c)
+
+    _registered = True
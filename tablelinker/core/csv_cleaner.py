@@ -29,6 +29,7 @@ class CSVCleaner(object):
         self.text_io = None
         self.csv_reader = None
         self.delimiter = ','
+        self.skip_lines = None
         self.encoding = "UTF-8"
 
         # Check if the fp is a bytes-file or a text-file.
@@ -65,8 +66,10 @@ class CSVCleaner(object):
         fp.seek(0)
 
     def open(self, as_dict: bool = False):
-        self.delimiter = self.get_delimiter()
-        self.skip_lines = self.get_skip_lines()
+        if self.skip_lines is None:
+            # Detect only once, reopening the same file reuses the results.
+            self.delimiter = self.get_delimiter()
+            self.skip_lines = self.get_skip_lines()
 
         self.text_io.seek(0)
         for _ in range(self.skip_lines):
@@ -90,6 +93,9 @@ class CSVCleaner(object):
     def __enter__(self, as_dict: bool = False):
         return self.open(as_dict=as_dict)
 
+    def __iter__(self):
+        return self
+
     def __next__(self):
         return self.csv_reader.__next__()
 
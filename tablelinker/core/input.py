@@ -8,6 +8,37 @@ from .csv_cleaner import CSVCleaner
 logger = getLogger(__name__)
 
 
+def _to_int(val: str):
+    # 例外処理は遅いので、よくある整数の形式は先に確認して変換する
+    num = val.replace(',', '')
+    digits = num[1:] if num[:1] in ('-', '+') else num
+    if digits.isdecimal():
+        return int(num)
+    elif not num:
+        return val  # 空欄
+
+    # 前後の空白や "1_000" なども int() に任せる
+    try:
+        return int(num)
+    except ValueError:
+        return val  # 数値ではないので文字列のまま
+
+
+def _to_float(val: str):
+    num = val.replace(',', '')
+    digits = num[1:] if num[:1] in ('-', '+') else num
+    if digits.replace('.', '', 1).isdecimal():
+        return float(num)
+    elif not num:
+        return val  # 空欄
+
+    # 指数表記や "nan" なども float() に任せる
+    try:
+        return float(num)
+    except ValueError:
+        return val  # 数値ではないので文字列のまま
+
+
 class InputCollection(object):
     """
     データセット(Array, File)
@@ -79,8 +110,11 @@ class CsvInputCollection(InputCollection):
     _float_pattern = fr'{_int_pattern}(\.\d+)?'
     _re_int = re.compile(rf'^{_int_pattern}$')
     _re_float = re.compile(rf'^{_float_pattern}$')
+    # 整数・実数を 1 回の照合で判定するためのパターン
+    _re_number = re.compile(
+        rf'^(?:(?P<int>{_int_pattern})|{_float_pattern})$')
 
-    def __init__(self, file_or_path, skip_cleaning=False):
+    def __init__(self, file_or_path, skip_cleaning=False, buffer_size=1 << 20):
         # file_or_path パラメータが File-like か PathLike か判別
         if all(hasattr(file_or_path, attr)
                for attr in ('seek', 'close', 'read')):
@@ -94,9 +128,17 @@ class CsvInputCollection(InputCollection):
             logger.debug("Detect path-like object.")
 
         self.skip_cleaning = skip_cleaning
+        self.buffer_size = buffer_size  # ファイルを開く際の読み込みバッファサイズ
         self.as_dict = False
         self.adjust_datatype = False
         self.headers = None
+        self._casters = []
+        self._kwargs = {}
+        self._fieldnames = None
+        self._restkey = None
+        self._restval = None
+        self._stream = None  # skip_cleaning の場合に読み込むテキストストリーム
+        self._cleaner = None
         self._reader = None
 
     def get_header_info(self):
@@ -112,43 +154,75 @@ class CsvInputCollection(InputCollection):
 
         Notes
         -----
-        - このメソッドを呼び出すと、ファイルの先頭に巻き戻されます。
+        - このメソッドを呼び出した後は、 ``open()`` または ``reset()`` で
+          ファイルの先頭から読み直してください。
         """
-        with self as reader:
-            header_titles = reader.__next__()
-            headers = [[x, 0, 0, 0] for x in header_titles]
-            for i, row in enumerate(reader):
-                if i == 20:
-                    break
-
-                if isinstance(row, dict):
-                    row = list(row.values())
-
-                for i in range(len(header_titles)):
-                    if len(row) <= i:
-                        continue
-
-                    if self._re_int.match(row[i]):
-                        headers[i][1] += 1
-                    elif self._re_float.match(row[i]):
-                        headers[i][2] += 1
-                    else:
-                        headers[i][3] += 1
-
+        self._bind_fp()
+        reader = self._make_reader()
+        header_titles = reader.__next__()
+        columns = [[] for _ in header_titles]
+        for i, row in enumerate(reader):
+            if i == 20:
+                break
+
+            for column, value in zip(columns, row):
+                column.append(value)
+
+        # 列ごとにまとめてデータ型を判定する
         detected_headers = []
-        for header in headers:
-            if header[1] >= header[2] and header[1] >= header[3]:
+        for title, column in zip(header_titles, columns):
+            nints = nfloats = 0
+            for m in map(self._re_number.match, column):
+                if m is None:
+                    continue
+                elif m.group('int') is None:
+                    nfloats += 1
+                else:
+                    nints += 1
+
+            nstrs = len(column) - nints - nfloats
+
+            if nints >= nfloats and nints >= nstrs:
                 data_type = int
-            elif header[2] >= header[1] and header[2] >= header[3]:
+            elif nfloats >= nints and nfloats >= nstrs:
                 data_type = float
             else:
                 data_type = str
 
-            detected_headers.append([header[0], data_type])
+            detected_headers.append([title, data_type])
 
-        self.close()
         return detected_headers
 
+    def set_casters(self):
+        """
+        推定されたデータ型から、数値列ごとの型変換関数の
+        リストを作成します。
+        """
+        self._casters = []
+        for i, (title, data_type) in enumerate(self.headers or []):
+            if data_type == int:
+                self._casters.append((i, title, _to_int))
+            elif data_type == float:
+                self._casters.append((i, title, _to_float))
+
+    def cast_row(self, row):
+        """
+        列ごとに推定された型に row の値を変換します。
+        row はリストでも dict でも構いません。
+        """
+        if isinstance(row, dict):
+            for _, title, cast in self._casters:
+                if isinstance(row.get(title), str):
+                    row[title] = cast(row[title])
+
+            return row
+
+        for i, _, cast in self._casters:
+            if i < len(row):
+                row[i] = cast(row[i])
+
+        return row
+
     def datatype_wrapper(self, as_dict: bool = False):
         """
         列ごとに推定された型に変更したリストを返す
@@ -157,17 +231,7 @@ class CsvInputCollection(InputCollection):
         self.close()
         with self.open(as_dict=as_dict) as reader:
             for row in reader:
-                output = row[:]
-                for i, val in enumerate(row):
-                    try:
-                        if self.headers[i][1] == int:
-                            output[i] = int(val.replace(',', ''))
-                        elif self.headers[i][1] == float:
-                            output[i] = float(val.replace(',', ''))
-                    except ValueError:
-                        pass  # 数値ではないので文字列のまま
-
-                yield output
+                yield self.cast_row(row.copy())
 
     def __enter__(self):
         if self._reader is None:
@@ -175,6 +239,55 @@ class CsvInputCollection(InputCollection):
 
         return self
 
+    def _bind_fp(self):
+        """
+        読み込むファイルオブジェクトを用意して先頭に巻き戻す。
+        パスが指定されていてファイルを開いていない場合のみ開く。
+        """
+        if self.path is not None and (self.fp is None or self.fp.closed):
+            if self.skip_cleaning:
+                self.fp = open(
+                    self.path, "r", newline="", buffering=self.buffer_size)
+            else:
+                self.fp = open(
+                    self.path, "rb", buffering=self.buffer_size)
+
+            self._stream = None
+            self._cleaner = None
+        elif self._stream is not None:
+            self._stream.seek(0)
+        else:
+            self.fp.seek(0)
+
+    def _make_reader(self, **kwargs):
+        """
+        先頭に巻き戻したファイルオブジェクトから reader を作る。
+        skip_cleaning が False の場合は CSVCleaner を返す。
+        エンコーディング等の判定結果は CSVCleaner が保持しているので、
+        同じファイルを読み直す場合は再利用する。
+        """
+        if not self.skip_cleaning:
+            # クリーニング
+            if self._cleaner is None:
+                self._cleaner = CSVCleaner(self.fp)
+
+            self._cleaner.open(**kwargs)
+            return self._cleaner
+
+        # ファイルをそのまま開く
+        if self._stream is None:
+            top = self.fp.read(1)
+            self.fp.seek(0)
+            if isinstance(top, bytes):
+                # バイトストリーム
+                self._stream = io.TextIOWrapper(
+                    self.fp, encoding="utf-8")
+            else:
+                # テキストストリーム
+                self._stream = self.fp
+
+        return csv.reader(self._stream, **kwargs)
+
     def _open(
             self,
             as_dict: bool = False,
@@ -184,42 +297,18 @@ class CsvInputCollection(InputCollection):
         ファイルを開く。
         skip_cleaning が False の場合、コンテンツを読み込み
         CSVCleaner で整形したバッファを開く。
-        """
-        reader = csv.reader
-        if as_dict is True:
-            reader = csv.DictReader
-
-        if self.skip_cleaning:
-            # ファイルをそのまま開く
-            if self.path is not None:
-                if self.fp is not None:
-                    self.fp.close()
-
-                self.fp = open(self.path, "r", newline="")
-                self._reader = reader(self.fp, **kwargs)
-            else:
-                self.fp.seek(0)
-                top = self.fp.read(1)
-                self.fp.seek(0)
-                if isinstance(top, bytes):
-                    # バイトストリーム
-                    stream = io.TextIOWrapper(
-                        self.fp, encoding="utf-8")
-                    self._reader = reader(stream, **kwargs)
-                else:
-                    # テキストストリーム
-                    self._reader = reader(self.fp, **kwargs)
-        else:
-            # ファイルをクリーニングしながら読み込む
-            if self.path is not None:
-                self.fp = open(self.path, "rb")
-            else:
-                self.fp.seek(0)
 
-            # クリーニング
-            self._reader = CSVCleaner(self.fp)
-            self._reader.open(as_dict=as_dict, **kwargs)
+        as_dict が True の場合も内部では csv.reader で読み込み、
+        next() で行を返す時に dict を作る。
+        """
+        self._kwargs = kwargs.copy()
+        self.as_dict = as_dict
+        self._fieldnames = kwargs.pop("fieldnames", None)
+        self._restkey = kwargs.pop("restkey", None)
+        self._restval = kwargs.pop("restval", None)
 
+        self._bind_fp()
+        self._reader = self._make_reader(**kwargs)
         return self
 
     def open(
@@ -234,6 +323,7 @@ class CsvInputCollection(InputCollection):
         """
         if adjust_datatype:
             self.headers = self.get_header_info()
+            self.set_casters()
 
         self.as_dict = as_dict
         self.adjust_datatype = adjust_datatype
@@ -251,6 +341,18 @@ class CsvInputCollection(InputCollection):
         if self.path is not None:
             if self.fp is not None:
                 self.fp.close()
+
+            self._stream = None
+            self._cleaner = None
+        elif self.fp.closed:
+            # 呼び出し側で既にストリームが閉じられている
+            self._stream = None
+        elif self._stream is not None and self._stream is not self.fp:
+            # 呼び出し側のバイトストリームを包んだ TextIOWrapper は
+            # 破棄時に元のストリームまで閉じてしまうので切り離す
+            self._stream.detach()
+            self._stream = None
+            self.fp.seek(0)
         else:
             self.fp.seek(0)
 
@@ -261,26 +363,52 @@ class CsvInputCollection(InputCollection):
         return False
 
     def reset(self):
-        self.open(
-            as_dict=self.as_dict,
-            adjust_datatype=self.adjust_datatype)
+        if self._reader is None:
+            self.open(
+                as_dict=self.as_dict,
+                adjust_datatype=self.adjust_datatype)
+            return
+
+        # 開いているファイルを先頭に巻き戻し、 reader だけ作り直す
+        self._open(as_dict=self.as_dict, **self._kwargs)
 
     def next(self):
         row = self._reader.__next__()
-        if not self.adjust_datatype:
-            return row
+        if self.as_dict:
+            if self._fieldnames is None:
+                # 先頭行は列名
+                self._fieldnames = row
+                row = self._reader.__next__()
+
+            while row == []:
+                # csv.DictReader と同様に空行はスキップ
+                row = self._reader.__next__()
+
+        if self.adjust_datatype:
+            row = self.cast_row(row)
 
-        for i, val in enumerate(row):
-            try:
-                if self.headers[i][1] == int:
-                    row[i] = int(val.replace(',', ''))
-                elif self.headers[i][1] == float:
-                    row[i] = float(val.replace(',', ''))
-            except ValueError:
-                pass  # 数値ではないので文字列のまま
+        if self.as_dict:
+            return self._to_dict(row)
 
         return row
 
+    def _to_dict(self, row: list) -> dict:
+        """
+        列名をキーとする dict に変換します。
+        列数が異なる場合は csv.DictReader と同じ規則で補います。
+        """
+        fieldnames = self._fieldnames
+        record = dict(zip(fieldnames, row))
+        nfields = len(fieldnames)
+        nvalues = len(row)
+        if nfields < nvalues:
+            record[self._restkey] = row[nfields:]
+        elif nfields > nvalues:
+            for key in fieldnames[nvalues:]:
+                record[key] = self._restval
+
+        return record
+
     def encode(self):
         return [self.filepath]
 
@@ -6,15 +6,24 @@ mapping.py
 Usage: python mapping.py
 """
 
+import concurrent.futures
 import copy
-from logging import getLogger
+import functools
+from logging import getLogger, DEBUG
 import os
+import threading
 from typing import List
 
 from munkres import Munkres
 import numpy as np
 from transformers import AutoModel, AutoTokenizer
 
+try:
+    # SciPy がインストールされていれば C 実装の割り当て計算を利用する
+    from scipy.optimize import linear_sum_assignment
+except ModuleNotFoundError:
+    linear_sum_assignment = None
+
 logger = getLogger(__name__)
 
 
@@ -25,6 +34,7 @@ class StringSimilarity(object):
     """
 
     @classmethod
+    @functools.lru_cache(maxsize=65536)
     def strsim(cls, term1, term2):
         """
         文字列 term1 と term2 の類似度を計算する
@@ -37,25 +47,16 @@ class StringSimilarity(object):
         ------
         float
             類似度（0 .. 1, 同一の場合1）
-        """
-        nlist1 = list(term1)
-        nlist2 = list(term2)
-        ulist1 = []
-        for i, c in enumerate(nlist1):
-            if i == 0:
-                ulist1.append("^"+nlist1[i])
-            else:
-                ulist1.append(nlist1[i-1]+nlist1[i])
 
-        ulist1.append(nlist1[-1]+"$")
-        ulist2 = []
-        for i, c in enumerate(nlist2):
-            if i == 0:
-                ulist2.append("^"+nlist2[i])
-            else:
-                ulist2.append(nlist2[i-1]+nlist2[i])
-
-        ulist2.append(nlist2[-1]+"$")
+        Note
+        ----
+        同じ文字列の組に対する計算結果はキャッシュされる。
+        """
+        # 先頭 "^" と末尾 "$" を付けた文字列の bigram リストを作る
+        padded1 = "^" + term1 + "$"
+        padded2 = "^" + term2 + "$"
+        ulist1 = [padded1[i:i+2] for i in range(len(padded1) - 1)]
+        ulist2 = [padded2[i:i+2] for i in range(len(padded2) - 1)]
         (match, mlist1, mlist2) = cls._match_str(ulist1, ulist2, 'char')
         size1 = len(ulist1)
         size2 = len(ulist2)
@@ -75,29 +76,34 @@ class StringSimilarity(object):
         size1 = len(list1)
         size2 = len(list2)
 
-        m = [[0 for i in range(size1+1)] for j in range(size2+1)]
-        for i in range(1, size1+1):
-            m[0][i] = i * _delcost
-        for j in range(1, size2+1):
-            m[j][0] = j * _inscost
+        # DP 表は連続した数値配列に保持する。
+        # 各行の計算はローカルなリストで行い、行単位で書き込む。
+        dtype = np.float64 if flag == 'word' else np.int32
+        m = np.empty((size2+1, size1+1), dtype=dtype)
+        m[0, :] = np.arange(size1+1) * _delcost
+        m[:, 0] = np.arange(size2+1) * _inscost
 
+        prev = m[0].tolist()
         for j in range(1, size2+1):
-            m[j][0] = j * _inscost
+            cur = [j * _inscost] + [0] * size1
+            item2 = list2[j-1]
             for i in range(1, size1+1):
-                v1 = m[j][i-1] + _delcost
-                v2 = m[j-1][i] + _inscost
+                v1 = cur[i-1] + _delcost
+                v2 = prev[i] + _inscost
 
-                if (list1[i-1] == list2[j-1]):
-                    v3 = m[j-1][i-1]
+                if (list1[i-1] == item2):
+                    v3 = prev[i-1]
                 else:
                     subcost = _subcost
                     if flag == 'word':
-                        simval = cls.strsim(list1[i-1], list2[j-1])
+                        simval = cls.strsim(list1[i-1], item2)
                         subcost = (1-simval)*2
-                    v3 = m[j-1][i-1] + subcost
+                    v3 = prev[i-1] + subcost
 
-                minval = min(v1, v2, v3)
-                m[j][i] = minval
+                cur[i] = min(v1, v2, v3)
+
+            m[j] = cur
+            prev = cur
 
         mlist1 = [0]*(size1)
         mlist2 = [0]*(size2)
@@ -105,11 +111,11 @@ class StringSimilarity(object):
         j = size2
         match = 0
         while (i > 0) and (j > 0):
-            v1 = m[j][i-1]
-            v2 = m[j-1][i-1]
-            v3 = m[j-1][i]
+            v1 = m[j, i-1]
+            v2 = m[j-1, i-1]
+            v3 = m[j-1, i]
             if (v2 <= v1) and (v2 <= v3):
-                if (m[j-1][i-1] == m[j][i]):
+                if (v2 == m[j, i]):
                     mlist2[j-1] = 1
                     mlist1[i-1] = 1
                     match += 1
@@ -177,14 +183,16 @@ class Similarity(object):
     def get_vectors(self):
         """
         事前計算済みベクトルをメモリに展開する
-        """
-        token_embeddings = self.model.get_input_embeddings().\
-            weight.clone()
 
-        vocab = self.tokenizer.get_vocab()
-        self.vectors = {}
-        for idx in vocab.values():
-            self.vectors[idx] = token_embeddings[idx].detach().numpy().copy()
+        Note
+        ----
+        見出し文字列の類似度計算には単精度は不要なので、
+        語彙全体の埋め込み行列を float16 で保持して
+        メモリ使用量を半分に抑える。
+        """
+        token_embeddings = self.model.get_input_embeddings().weight
+        self.token_matrix = token_embeddings.detach().numpy().astype(
+            np.float16)
 
     def item2vec(self, text: str):
         """
@@ -202,7 +210,7 @@ class Similarity(object):
             語ベクトル
         """
         ids = self.tokenizer.encode(text, add_special_tokens=False)
-        embeddings = np.array([self.vectors[id] for id in ids])
+        embeddings = self.token_matrix[ids].astype(np.float32)
         average_embeddings = np.average(embeddings, axis=0)
         assert average_embeddings.shape == (768,)
         return average_embeddings
@@ -241,6 +249,7 @@ class ItemsPair(object):
         編集距離による類似度を格納する行列
     """
     similarity = None  # Similarity()  # 時間がかかるのでオンデマンド登録
+    _similarity_future = None  # バックグラウンドで読み込み中の Similarity
 
     def __init__(self, items0: List[str], items1: List[str]):
         """
@@ -256,6 +265,52 @@ class ItemsPair(object):
         self.mxsim = None
         self.mxed = None
 
+    @classmethod
+    def preload(cls):
+        """
+        Similarity（事前学習済みモデル）の読み込みを
+        バックグラウンドのスレッドで開始する
+
+        Note
+        ----
+        文字列の類似度の計算など、モデルを使わない処理と
+        モデルの読み込みを並行して行うために利用する。
+        既に読み込み済み、または読み込み中の場合は何もしない。
+        """
+        if cls.similarity is not None or cls._similarity_future is not None:
+            return
+
+        future = concurrent.futures.Future()
+
+        def load():
+            try:
+                future.set_result(Similarity())
+            except BaseException as e:
+                future.set_exception(e)
+
+        cls._similarity_future = future
+        threading.Thread(target=load, daemon=True).start()
+
+    @classmethod
+    def get_similarity(cls) -> Similarity:
+        """
+        Similarity オブジェクトを取得する
+
+        Note
+        ----
+        preload() で読み込み中の場合は完了を待つ。
+        読み込みを開始していない場合はここで読み込む。
+        """
+        if cls.similarity is None:
+            future = cls._similarity_future
+            if future is not None:
+                cls._similarity_future = None
+                cls.similarity = future.result()
+            else:
+                cls.similarity = Similarity()
+
+        return cls.similarity
+
     def get_weighted_matrix(self):
         """
         items0 と items1 の類似度を計算し、mxsim, mxed に格納する
@@ -269,29 +324,37 @@ class ItemsPair(object):
         if self.mxsim is not None and self.mxed is not None:
             return self.mxsim, self.mxed
 
-        if self.__class__.similarity is None:
-            self.__class__.similarity = Similarity()
+        if self.items0 == self.items1:
+            # 見出しが完全に一致する場合は類似度の計算を省略する
+            self.mxsim = -np.eye(len(self.items0))
+            self.mxed = -np.eye(len(self.items0))
+            return self.mxsim, self.mxed
 
-        vec0 = [
-            self.__class__.similarity.item2vec(name)
-            for name in self.items0]
-        vec1 = [
-            self.__class__.similarity.item2vec(name)
-            for name in self.items1]
         dim = max(len(self.items0), len(self.items1))
         self.mxsim = np.zeros((dim, dim))
         self.mxed = np.zeros((dim, dim))
+        if not self.items0 or not self.items1:
+            # 一方の見出しが空の場合、類似度はすべて 0
+            return self.mxsim, self.mxed
 
-        for j in range(len(vec1)):
-            for i in range(len(vec0)):
+        # 文字列の類似度を計算する間に類似度計算用のモデルを読み込んでおく
+        self.__class__.preload()
+        for j in range(len(self.items1)):
+            for i in range(len(self.items0)):
                 ed = StringSimilarity.strsim(self.items0[i], self.items1[j])
-                sim = Similarity.cos_sim(vec0[i], vec1[j])
-                if sim < 0.0:
-                    sim = 0.0
-
-                self.mxsim[i, j] = -1.0 * sim
                 self.mxed[i, j] = -1.0 * ed
 
+        similarity = self.__class__.get_similarity()
+        vec0 = np.array([similarity.item2vec(name) for name in self.items0])
+        vec1 = np.array([similarity.item2vec(name) for name in self.items1])
+
+        # 語ベクトルを先に正規化しておき、コサイン類似度を
+        # 内積（行列積）でまとめて計算する
+        vec0 /= np.maximum(np.linalg.norm(vec0, axis=1, keepdims=True), 1e-12)
+        vec1 /= np.maximum(np.linalg.norm(vec1, axis=1, keepdims=True), 1e-12)
+        sims = np.maximum(vec0 @ vec1.T, 0.0)
+        self.mxsim[:len(vec0), :len(vec1)] = -1.0 * sims
+
         return self.mxsim, self.mxed
 
     def match(self):
@@ -302,16 +365,27 @@ class ItemsPair(object):
         -------
         np.matrix
             最適割り当てを行った結果行列。
+
+        Note
+        ----
+        SciPy がインストールされている場合は
+        ``scipy.optimize.linear_sum_assignment`` を利用する。
         """
         self.get_weighted_matrix()
 
         mtx = self.mxsim
-        ansMtx = Munkres().compute(copy.copy(mtx))
-        asum = sum([mtx[idx] for idx in ansMtx])
-
-        logger.debug(ansMtx)
-        logger.debug(f"Minimum sum = {asum}")
-        logger.debug(mtx)
+        if linear_sum_assignment is not None:
+            row_ind, col_ind = linear_sum_assignment(mtx)
+            ansMtx = list(zip(row_ind.tolist(), col_ind.tolist()))
+        else:
+            ansMtx = Munkres().compute(mtx.tolist())
+
+        if logger.isEnabledFor(DEBUG):
+            asum = mtx[
+                [i for i, _ in ansMtx], [j for _, j in ansMtx]].sum()
+            logger.debug(ansMtx)
+            logger.debug(f"Minimum sum = {asum}")
+            logger.debug(mtx)
 
         return ansMtx
 
@@ -64,22 +64,37 @@ class ArrayOutputCollection(OutputCollection):
 
 
 class CsvOutputCollection(OutputCollection):
-    def __init__(self, filepath):
+    def __init__(self, filepath, batch_size=1024):
         self._filepath = filepath
         self._file = None
         self._writer = None
+        self._batch = []
+        self._batch_size = batch_size  # まとめて書き込む行数
 
     def open(self):
         self._file = self.open_file()
         self._writer = csv.writer(self._file)
+        self._batch = []
 
     def open_file(self):
         return open(self._filepath, "w", newline="")
 
     def append(self, value):
-        return self._writer.writerow(value)
+        # 書き込むまでに呼び出し側で行が変更されても影響しないようコピーする
+        self._batch.append(list(value))
+        if len(self._batch) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        バッファに溜まっている行をファイルに書き込みます。
+        """
+        if self._batch:
+            self._writer.writerows(self._batch)
+            self._batch = []
 
     def close(self):
+        self.flush()
         self._file.close()
 
     def get_data(self):
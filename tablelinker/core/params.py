@@ -1,4 +1,4 @@
-from abc import ABC
+import functools
 import json
 from logging import getLogger
 import re
@@ -7,6 +7,48 @@ from .validators import IntValidator, BooleanValidator, RequiredValidator
 
 logger = getLogger(__name__)
 
+# 数字と符号・小数点だけからなる文字列（指数表記は受け付けない）
+_NUMBER_RE = re.compile(r'^[\-?\d*\.?\d+]+$')
+# 列番号を表す数字のみの文字列
+_INT_STR_RE = re.compile(r'^\d+$')
+
+# 各パラメータが共有するバリデータ
+# （インスタンス間で共有するため、バリデータは状態を持たないこと）
+_INT_VALIDATORS = (IntValidator(),)
+_BOOL_VALIDATORS = (BooleanValidator(),)
+_REQUIRED_VALIDATOR = RequiredValidator()
+
+
+def _get_header_index(context):
+    """
+    コンテキストに保存されている見出し行と、
+    列名から列番号を引く辞書を返します。
+
+    辞書は見出し行のコピーと組にしてコンテキストに保存し、
+    見出し行が変わっていなければ再利用します。
+    同じ列名が複数ある場合は最初の列の番号を返します。
+    """
+    try:
+        headers = context.get_data("headers") or []
+    except KeyError:
+        headers = []
+
+    try:
+        cached = context.get_data("_headers_index")
+    except KeyError:
+        cached = None
+
+    key = tuple(headers)
+    if cached is not None and cached[0] == key:
+        return headers, cached[1]
+
+    idx_map = {}
+    for i, header in enumerate(headers):
+        idx_map.setdefault(header, i)
+
+    context.set_data("_headers_index", (key, idx_map))
+    return headers, idx_map
+
 
 class ParamSet(object):
     def __init__(self, *args):
@@ -21,7 +63,7 @@ class ParamSet(object):
         return len(self._list)
 
     def __contains__(self, item):
-        return [param for param in self._list if param.name == item]
+        return item in self._dist
 
     def __getitem__(self, item):
         return self._dist.get(item)
@@ -37,10 +79,10 @@ class ParamSet(object):
             self.append(o)
 
     def keys(self):
-        return [param.key for param in self._list]
+        return list(self._dist)
 
     def params(self):
-        return [param for param in self._list]
+        return list(self._list)
 
     def append(self, param):
         if param is None:
@@ -49,7 +91,7 @@ class ParamSet(object):
             self._list.append(param)
             self._dist[param.name] = param
         else:
-            raise "duplicate key."  # FIXME
+            raise ValueError("duplicate key: {}".format(param.name))
 
     def validate(self, param_values, errors, input=None, output=None):
         for param in self._list:
@@ -61,7 +103,14 @@ class ParamSet(object):
         return not errors.has_error()
 
 
-class Param(ABC):
+class Param(object):
+
+    __slots__ = (
+        "name", "description", "help_text", "label", "default_value",
+        "group", "required", "_validators", "_arguments",
+        "_validator_calls",
+    )
+
     def __init__(
         self,
         name,
@@ -80,12 +129,34 @@ class Param(ABC):
         self.default_value = default_value
         self.group = group
         self.required = required
+        self._arguments = None
+
+        param_validators = self.default_validators()
+        if validators is not None:
+            param_validators = (*validators, *param_validators)
 
-        self.validators = validators + self.default_validators() \
-            if validators is not None \
-            else self.default_validators()
         if required:
-            self.validators = (RequiredValidator(),) + self.validators
+            param_validators = (_REQUIRED_VALIDATOR, *param_validators)
+
+        self.validators = param_validators
+
+    @property
+    def validators(self):
+        """パラメータの値を検証するバリデータのタプルです。
+        """
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        self._validators = tuple(validators)
+
+        # validate() で呼び出す関数と、エラー時に検証を中断するかどうかの組
+        # （バリデータが差し替えられるたびに作り直す）
+        self._validator_calls = tuple(
+            (validator, False) if callable(validator)
+            else (functools.partial(validator.valid, param=self),
+                  validator.stop_when_error())
+            for validator in self._validators)
 
     @property
     def key(self):
@@ -108,16 +179,10 @@ class Param(ABC):
 
     def validate(self, value, errors, input=None, output=None):
         result = True
-        for validator in self.validators:
-            r = (
-                validator(value, errors, input=input, output=output)
-                if callable(validator)
-                else validator.valid(
-                    value, errors, self, input=input, output=output)
-            )
-            if r is False:
+        for func, stop_when_error in self._validator_calls:
+            if func(value, errors, input=input, output=output) is False:
                 result = False
-                if validator.stop_when_error():
+                if stop_when_error:
                     break
 
         return result
@@ -141,6 +206,22 @@ class Param(ABC):
 
     @property
     def arguments(self):
+        """フロントエンドに渡すパラメータ固有の引数です。
+
+        初回のアクセス時に作成して保持し、以降はそのコピーを返します。
+        """
+        arguments = self._arguments
+        if arguments is None:
+            arguments = self._arguments = self.build_arguments()
+
+        # 呼び出し側で変更されても保持している値に影響しないようにする
+        return dict(arguments)
+
+    def build_arguments(self):
+        """arguments の内容を作成します。
+
+        パラメータ固有の引数を持つクラスはこのメソッドを拡張します。
+        """
         return {}
 
     @classmethod
@@ -149,7 +230,7 @@ class Param(ABC):
         val = val.replace(',', '')
 
         # 数字と小数点以外を含む場合は例外
-        if not re.match(r'^[\-?\d*\.?\d+]+$', val):
+        if not _NUMBER_RE.match(val):
             raise ValueError("値 '{}' は数値ではありません。".format(val))
 
         return float(val)
@@ -159,23 +240,31 @@ class TextParam(Param):
     class Meta:
         type = "text"
 
+    __slots__ = ()
+
 
 class StringParam(Param):
     class Meta:
         type = "string"
 
+    __slots__ = ()
+
 
 class StringListParam(Param):
     class Meta:
         type = "string_list"
 
+    __slots__ = ()
+
 
 class IntParam(Param):
     class Meta:
         type = "integer"
 
+    __slots__ = ()
+
     def default_validators(self):
-        return (IntValidator(),)
+        return _INT_VALIDATORS
 
     def parse_value(self, value):
         return int(value)
@@ -185,27 +274,32 @@ class EnumsParam(Param):
     class Meta:
         type = "enums"
 
+    __slots__ = ("enums", "labels")
+
     def __init__(
             self,
             *args,
             enums=None,
             labels=None,
-            default_value: None,
+            default_value=None,
             **kwargs):
         """
         :enums: Enumクラス 例:class Xxxx(Enum):...
         :enums_labels: Enumsのラベルハッシュ
+        :default_value: デフォルト値（Enumsの要素）
         """
-        super(EnumsParam, self).__init__(*args, **kwargs)
+        super(EnumsParam, self).__init__(
+            *args,
+            default_value=(
+                default_value.value if default_value is not None else None),
+            **kwargs)
         self.enums = enums
         self.labels = labels
-        self.default_value = default_value.value
 
     def parse_value(self, value):
         return self.enums(value)
 
-    @property
-    def arguments(self):
+    def build_arguments(self):
         enum_values = [{
             "value": str(enum.value),
             "label": self.labels[enum]} for enum in self.enums]
@@ -218,20 +312,19 @@ class BooleanParam(Param):
     class Meta:
         type = "boolean"
 
+    __slots__ = ()
+
     def default_validators(self):
-        return (BooleanValidator(),)
+        return _BOOL_VALIDATORS
 
     def parse_value(self, value):
         if isinstance(value, bool):
             return value
         elif isinstance(value, str):
-            if value.lower() == 'true':
-                value = True
-            else:
-                value = False
+            return value.lower() == "true"
 
-        logger.warning("boolean: parse_value -> '{}'({})".format(
-            str(value), type(value)))
+        logger.warning(
+            "boolean: parse_value -> '%s'(%s)", value, type(value).__name__)
         return value
 
 
@@ -243,6 +336,8 @@ class CollectionParam(Param):
     class Meta:
         type = "collection"
 
+    __slots__ = ()
+
     def get_value(self, value, context):
         return context.get_proxy(value)
 
@@ -256,6 +351,11 @@ class AttributeParam(Param):
     class Meta:
         type = "attribute"
 
+    __slots__ = (
+        "collection_param_name", "label_prefix", "label_suffix",
+        "empty", "empty_value", "empty_label",
+    )
+
     def __init__(
         self,
         *args,
@@ -275,8 +375,7 @@ class AttributeParam(Param):
         self.empty_value = empty_value
         self.empty_label = empty_label
 
-    @property
-    def arguments(self):
+    def build_arguments(self):
         return {
             "collection_param_name": self.collection_param_name,
             "label_prefix": self.label_prefix,
@@ -287,7 +386,7 @@ class AttributeParam(Param):
         }
 
     def default_validators(self):
-        return (IntValidator(),)
+        return _INT_VALIDATORS
 
     def get_column_number(
             self,
@@ -313,22 +412,27 @@ class AttributeParam(Param):
         int
             列番号。存在しない場合は -1。
         """
-        headers = context.get_data("headers") or []
+        headers, idx_map = _get_header_index(context)
+        return self._resolve(value, headers, idx_map, allow_error)
+
+    def _resolve(self, value, headers, idx_map, allow_error):
+        """
+        列名または列番号を、見出し行と列名の辞書を使って列番号に変換します。
+        """
         if isinstance(value, str):
-            try:
-                idx = headers.index(value)
+            idx = idx_map.get(value)
+            if idx is not None:
                 value = idx
-            except ValueError:
-                # 数値を文字列で指定している場合に対応
-                if re.match(r'^\d+$', value):
-                    value = int(value)
-                elif allow_error:
-                    value = -1
-                else:
-                    raise ValueError((
-                        "パラメータ '{}' で指定された列名 '{}' は"
-                        "有効な列名ではありません。有効な列名は次の通り; {}"
-                    ).format(self.name, value, ",".join(headers)))
+            # 数値を文字列で指定している場合に対応
+            elif _INT_STR_RE.match(value):
+                value = int(value)
+            elif allow_error:
+                value = -1
+            else:
+                raise ValueError((
+                    "パラメータ '{}' で指定された列名 '{}' は"
+                    "有効な列名ではありません。有効な列名は次の通り; {}"
+                ).format(self.name, value, ",".join(headers)))
 
         if value < -1 or value >= len(headers):
             if allow_error:
@@ -350,12 +454,9 @@ class AttributeListParam(AttributeParam):
     class Meta:
         type = "attribute-list"
 
-    def __init__(self, *args, collection_param_name=None, **kwargs):
-        super(AttributeListParam, self).__init__(*args, **kwargs)
-        self.collection_param_name = collection_param_name
+    __slots__ = ()
 
-    @property
-    def arguments(self):
+    def build_arguments(self):
         return {"collection_param_name": self.collection_param_name}
 
     def default_validators(self):
@@ -385,11 +486,42 @@ class AttributeListParam(AttributeParam):
         -------
         List[int]
             列番号のリスト。存在しない列は -1。
+
+        Notes
+        -----
+        values は変更せず、新しいリストを返します。
+        """
+        headers, idx_map = _get_header_index(context)
+        return self._resolve_list(values, headers, idx_map, allow_error)
+
+    def _resolve_list(self, values, headers, idx_map, allow_error):
+        """
+        列名または列番号のリストを、見出し行と列名の辞書を使って
+        列番号のリストに変換します。
         """
+        n = len(headers)
+        is_digits = _INT_STR_RE.match
+        columns = [0] * len(values)
         for i, value in enumerate(values):
-            values[i] = self.get_column_number(value, context, allow_error)
+            if isinstance(value, str):
+                idx = idx_map.get(value)
+                if idx is None:
+                    if is_digits(value):
+                        idx = int(value)
+                    else:
+                        # 列名が見つからない場合のエラー処理
+                        idx = self._resolve(
+                            value, headers, idx_map, allow_error)
+            else:
+                idx = value
+
+            if idx < -1 or idx >= n:
+                # 範囲外の列番号のエラー処理
+                idx = self._resolve(idx, headers, idx_map, allow_error)
 
-        return values
+            columns[i] = idx
+
+        return columns
 
 
 class InputAttributeParam(AttributeParam):
@@ -401,6 +533,8 @@ class InputAttributeParam(AttributeParam):
     class Meta:
         type = "input-attribute"
 
+    __slots__ = ()
+
     def get_value(self, value, context):
         """
         入力列の番号を取得します。
@@ -425,6 +559,8 @@ class InputAttributeListParam(AttributeListParam):
     class Meta:
         type = "input-attribute-list"
 
+    __slots__ = ()
+
     def get_value(self, values, context):
         """
         入力列の番号リストを取得します。
@@ -448,12 +584,13 @@ class OutputAttributeParam(AttributeParam):
     class Meta:
         type = "output-attribute"
 
+    __slots__ = ("prefix",)
+
     def __init__(self, *args, prefix=False, **kwargs):
         super(OutputAttributeParam, self).__init__(*args, **kwargs)
         self.prefix = prefix
 
-    @property
-    def arguments(self):
+    def build_arguments(self):
         return {"prefix": self.prefix}
 
     def get_value(self, value, context):
@@ -478,6 +615,8 @@ class OutputAttributeListParam(AttributeListParam):
     class Meta:
         type = "output-attribute-list"
 
+    __slots__ = ()
+
     def get_value(self, values, context):
         """
         出力列の番号のリストを取得します。
@@ -499,3 +638,5 @@ class DictParam(Param):
 
     class Meta:
         type = "dict"
+
+    __slots__ = ()
@@ -1,17 +1,15 @@
 import codecs
-from collections import OrderedDict
 import csv
+import datetime
 import io
-from logging import getLogger
+from itertools import islice
+from logging import DEBUG, getLogger
 import math
 import os
-import re
 import sys
 import tempfile
-from typing import List, Optional, Union
-
-import pandas as pd
-from pandas.core.frame import DataFrame
+from typing import List, Optional, TYPE_CHECKING, Union
+import zipfile
 
 from ..convertors import basics as basic_convertors
 from .context import Context
@@ -21,11 +19,16 @@ from .mapping import ItemsPair
 from .output import CsvOutputCollection
 from .task import Task
 
+if TYPE_CHECKING:
+    import pandas
+
 
 logger = getLogger(__name__)
 
 basic_convertors.register()  # コンバータリストを初期化
 session_tmpdir = None  # セッション内で有効な一時ディレクトリ
+ESCAPE_ENCODING_LOG_LIMIT = 10  # 警告を出力するエンコーディングエラーの最大数
+_escape_encoding_count = 0  # 現在の出力処理で発生したエンコーディングエラーの数
 
 
 def escape_encoding(exc):
@@ -35,11 +38,33 @@ def escape_encoding(exc):
     https://docs.python.org/ja/3.5/library/codecs.html#codecs.register_error
 
     変換できなかった文字を '??' に置き換えます。
+
+    Notes
+    -----
+    警告は出力処理ごとに最初の ESCAPE_ENCODING_LOG_LIMIT 件のみ出力し、
+    それ以降は出力を省略します。
     """
-    logger.warning(str(exc))
+    global _escape_encoding_count
+
+    _escape_encoding_count += 1
+    if _escape_encoding_count <= ESCAPE_ENCODING_LOG_LIMIT:
+        logger.warning("%s", exc)
+    elif _escape_encoding_count == ESCAPE_ENCODING_LOG_LIMIT + 1:
+        logger.warning("以降のエンコーディングエラーの警告は省略します。")
+
     return ('??', exc.end)
 
 
+def _reset_escape_encoding_count() -> None:
+    """
+    エンコーディングエラーの数をリセットします。
+    save(), merge() などの出力処理の開始時に呼び出します。
+    """
+    global _escape_encoding_count
+
+    _escape_encoding_count = 0
+
+
 def NamedTemporaryFile(*args, **kwargs):
     """
     セッション内で有効な一時ディレクトリの下に、名前付き一時ファイルを作ります。
@@ -68,6 +93,310 @@ def NamedTemporaryFile(*args, **kwargs):
     return tmpf
 
 
+def release_tempfile(path: os.PathLike) -> None:
+    """
+    NamedTemporaryFile() で作成した一時ファイルを削除します。
+    ファイルが既に存在しない場合は何もしません。
+
+    Notes
+    -----
+    - 呼び出し側がパスを保持している可能性があるため、
+      一時ファイルは再利用せずに削除します。
+    """
+    path = str(path)
+    if not os.path.exists(path):
+        return
+
+    os.remove(path)
+    logger.debug("一時ファイル '{}' を削除しました".format(path))
+
+
+# Excel のシートを CSV に変換する際、メモリ上に保持する最大サイズ
+# これを超えると一時ファイルに書き出す
+EXCEL_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+# Excel ファイルの先頭のマジックナンバー
+_XLSX_MAGIC = b"PK\x03\x04"  # ZIP (xlsx)
+_XLS_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # OLE2 (xls)
+
+
+def _detect_excel_format(file) -> Optional[str]:
+    """
+    ファイルの先頭 8 バイトから Excel ファイルの形式を判定します。
+
+    Returns
+    -------
+    str, None
+        xlsx 形式の場合は "xlsx"、 xls 形式の場合は "xls"、
+        それ以外の場合は None。
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            head = f.read(8)
+    else:
+        file.seek(0)
+        head = file.read(8)
+        file.seek(0)
+
+    if not isinstance(head, bytes):
+        return None  # テキストストリーム
+    elif head.startswith(_XLSX_MAGIC):
+        return "xlsx"
+    elif head.startswith(_XLS_MAGIC):
+        return "xls"
+
+    return None
+
+
+def _excel_value_to_str(value) -> str:
+    """
+    Excel のセルの値を CSV に出力する文字列に変換します。
+    """
+    if value is None:
+        return ""
+
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+
+    if isinstance(value, datetime.datetime) and \
+            value.time() == datetime.time(0):
+        return value.date().isoformat()
+
+    return str(value)
+
+
+class _SheetNotFoundError(ValueError):
+    """
+    Excel ファイルに指定したシートが含まれていない場合に送出されます。
+    """
+
+
+def _select_sheet(names: List[str], sheet) -> int:
+    """
+    シート名またはシート番号から、シートの番号を返します。
+    該当するシートがない場合は _SheetNotFoundError を送出します。
+    """
+    if sheet is None:
+        return 0
+
+    if sheet in names:
+        return names.index(sheet)
+
+    if isinstance(sheet, str) and sheet.isdigit():
+        sheet = int(sheet)
+
+    if isinstance(sheet, int) and 0 <= sheet < len(names):
+        return sheet
+
+    raise _SheetNotFoundError("Worksheet '{}' not found.".format(sheet))
+
+
+def _xlsx_rows(file, sheet):
+    """
+    xlsx 形式のファイルの行を順番に返すイテレータを返します。
+    xlsx 形式ではない場合は None を返します。
+    """
+    # CSV だけを扱う場合に読み込まないよう、必要な時に読み込む
+    import openpyxl
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    fp = open(file, "rb") if isinstance(file, (str, os.PathLike)) else file
+    try:
+        wb = openpyxl.load_workbook(fp, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError):
+        if fp is not file:
+            fp.close()
+
+        return None
+
+    try:
+        ws = wb.worksheets[_select_sheet(wb.sheetnames, sheet)]
+    except ValueError:
+        wb.close()
+        if fp is not file:
+            fp.close()
+
+        raise
+
+    def _rows():
+        try:
+            for row in ws.iter_rows(values_only=True):
+                yield [_excel_value_to_str(v) for v in row]
+        finally:
+            wb.close()
+            if fp is not file:
+                fp.close()
+
+    return _rows()
+
+
+def _xls_rows(file, sheet):
+    """
+    xls 形式のファイルの行を順番に返すイテレータを返します。
+    xls 形式ではない場合は None を返します。
+    """
+    import xlrd  # CSV だけを扱う場合に読み込まないよう、必要な時に読み込む
+
+    try:
+        if isinstance(file, (str, os.PathLike)):
+            book = xlrd.open_workbook(file, on_demand=True)
+        else:
+            book = xlrd.open_workbook(
+                file_contents=file.read(), on_demand=True)
+    except xlrd.XLRDError:
+        return None
+
+    try:
+        ws = book.sheet_by_index(_select_sheet(book.sheet_names(), sheet))
+    except ValueError:
+        book.release_resources()
+        raise
+
+    def _rows():
+        try:
+            for i in range(ws.nrows):
+                row = []
+                for cell in ws.row(i):
+                    value = cell.value
+                    if cell.ctype == xlrd.XL_CELL_DATE:
+                        value = xlrd.xldate_as_datetime(value, book.datemode)
+                    elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                        value = bool(value)
+                    elif cell.ctype in (
+                            xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK,
+                            xlrd.XL_CELL_ERROR):
+                        value = None
+
+                    row.append(_excel_value_to_str(value))
+
+                yield row
+        finally:
+            book.release_resources()
+
+    return _rows()
+
+
+def _dedup_header(header: List[str]) -> List[str]:
+    """
+    重複する見出しに ".1", ".2" ... を付けて区別します。
+    pandas.read_excel と同じ規則で、既にある見出しと
+    重ならない名前を付けます。空の見出しはそのまま残します。
+    """
+    counts = {}
+    result = list(header)
+    for i, name in enumerate(header):
+        if name == "":
+            continue
+
+        count = counts.get(name, 0)
+        new_name = name
+        while count > 0:
+            counts[name] = count + 1
+            new_name = "{}.{}".format(name, count)
+            if new_name in header:
+                count += 1
+            else:
+                count = counts.get(new_name, 0)
+
+        result[i] = new_name
+        counts[new_name] = count + 1
+
+    return result
+
+
+class _MergeOutputCollection(CsvOutputCollection):
+    """
+    結合先の CSV ファイルの末尾に、見出し行を除いて追記する
+    出力コレクション。
+
+    文字エンコーディングと区切り文字は結合先ファイルに合わせます。
+    """
+
+    def __init__(self, filepath, encoding, delimiter):
+        super().__init__(filepath)
+        self._encoding = encoding
+        self._delimiter = delimiter
+        self._header_skipped = False
+
+    def open(self):
+        self._file = self.open_file()
+        self._writer = csv.writer(self._file, delimiter=self._delimiter)
+        self._batch = []
+        self._header_skipped = False
+
+    def open_file(self):
+        return open(
+            self._filepath, "a", newline="",
+            encoding=self._encoding, errors="escape_encoding")
+
+    def append(self, value):
+        if not self._header_skipped:
+            # 見出し行は出力しない
+            self._header_skipped = True
+            return
+
+        super().append(value)
+
+
+def excel_to_csv(file, sheet=None):
+    """
+    Excel ファイルの指定したシートを CSV に変換します。
+
+    Parameters
+    ----------
+    file: File-like, Path-like
+        Excel ファイルのパス、または file-like オブジェクト。
+    sheet: str, int, optional
+        シート名またはシート番号。省略された場合は最初のシート。
+
+    Returns
+    -------
+    File-like, None
+        CSV を書き出して先頭に巻き戻したテキストファイルオブジェクト。
+        Excel ファイルではない場合は None を返します。
+
+    Notes
+    -----
+    - 行を 1 行ずつ読みながら書き出すため、シート全体を
+      DataFrame や文字列としてメモリ上に保持しません。
+    - 指定したシートが存在しない場合は ValueError を送出します。
+    - pandas.read_excel と同様に、すべてのセルが空の行は出力せず、
+      重複する見出しには ".1", ".2" ... を付けます。
+    """
+    excel_format = _detect_excel_format(file)
+    if excel_format == "xlsx":
+        rows = _xlsx_rows(file, sheet)
+    elif excel_format == "xls":
+        rows = _xls_rows(file, sheet)
+    else:
+        rows = None
+
+    if rows is None:
+        if not isinstance(file, (str, os.PathLike)):
+            file.seek(0)
+
+        return None
+
+    buf = tempfile.SpooledTemporaryFile(
+        max_size=EXCEL_SPOOL_MAX_SIZE, mode="w+",
+        encoding="utf-8", newline="")
+    writer = csv.writer(buf)
+    is_header = True
+    for row in rows:
+        if not any(row):
+            continue  # 空行は読み飛ばす
+
+        if is_header:
+            row = _dedup_header(row)
+            is_header = False
+
+        writer.writerow(row)
+
+    buf.seek(0)
+    return buf
+
+
 class Table(object):
     r"""
     表形式データを管理するクラスです。
@@ -168,6 +497,7 @@ class Table(object):
         self.filetype = "csv"
         self.headers = None
         self._reader = None
+        self._cached_header = None  # 読み込み済みの見出し行
 
         if file is None and data is None:
             raise RuntimeError("file と data のどちらかを指定してください。")
@@ -191,11 +521,8 @@ class Table(object):
         ファイルが残っている場合、先にファイルを消去します。
         """
         self.close()
-        if self.is_tempfile is True and \
-                os.path.exists(self.file):
-            os.remove(self.file)
-            logger.debug("一時ファイル '{}' を削除しました".format(
-                self.file))
+        if self.is_tempfile is True:
+            release_tempfile(self.file)
 
     def __enter__(self):
         if self._reader is None:
@@ -210,6 +537,44 @@ class Table(object):
         row = self._reader.__next__()
         return row
 
+    def iter_batches(self, n: int = 4096):
+        """
+        開いている表データから、最大 n 行ずつのリストを返す
+        ジェネレータです。
+
+        Parameters
+        ----------
+        n: int [default:4096]
+            1 回に返す最大行数。
+
+        Examples
+        --------
+        >>> from tablelinker import Table
+        >>> table = Table("sample/datafiles/hachijo_sightseeing.csv")
+        >>> with table.open() as reader:
+        ...     for batch in reader.iter_batches(3):
+        ...         print(len(batch))
+        ...         break
+        ...
+        3
+
+        Notes
+        -----
+        - 表データを開いていない場合は open() します。
+        - 1 行ずつ取り出す場合に比べて、行ごとの Python の
+          呼び出しコストをまとめて処理できます。
+        """
+        if self._reader is None:
+            self.open()
+
+        source = self._reader
+        while True:
+            batch = list(islice(source, n))
+            if not batch:
+                break
+
+            yield batch
+
     def __exit__(self, exception_type, exception_value, traceback):
         try:
             self._reader.__exit__(
@@ -299,23 +664,27 @@ class Table(object):
         - 表データの確認とクリーニングは、このメソッドが
           呼ばれたときに実行されます。
         """
+        # 開いている reader を閉じずに差し替えると、破棄される時に
+        # 呼び出し側のストリームまで閉じてしまうので先に閉じる
+        self.close()
+
+        # ファイルが書き換えられている可能性があるので見出し行を読み直す
+        self._cached_header = None
+
         self.filetype = None
         if not self.skip_cleaning:
             # エクセルファイルとして読み込む
             try:
-                if self.sheet is None:
-                    df = pd.read_excel(self.file, sheet_name=0)
-                else:
-                    try:
-                        df = pd.read_excel(self.file, sheet_name=self.sheet)
-                    except ValueError:
-                        if re.match(r'^\d+', self.sheet):
-                            self.sheet = int(self.sheet)
-                        df = pd.read_excel(self.file, sheet_name=self.sheet)
-
-                data = df.to_csv(index=False)
+                data = excel_to_csv(self.file, self.sheet)
+            except _SheetNotFoundError:
+                logger.error(
+                    "対象にはシート '{}' は含まれていません。".format(
+                        self.sheet))
+                raise ValueError("Invalid sheet name.")
+
+            if data is not None:
                 self._reader = CsvInputCollection(
-                    file_or_path=io.StringIO(data),
+                    file_or_path=data,
                     skip_cleaning=False).open(
                         as_dict=as_dict,
                         adjust_datatype=adjust_datatype,
@@ -323,16 +692,6 @@ class Table(object):
 
                 self.filetype = "excel"
 
-            except ValueError as e:
-                if str(e).lower().startswith(
-                        "excel file format cannot be determined"):
-                    pass  # Excel ファイルではないので CSV として開く
-                elif self.sheet is not None:
-                    logger.error(
-                        "対象にはシート '{}' は含まれていません。".format(
-                            self.sheet))
-                    raise ValueError("Invalid sheet name.")
-
         if self.filetype is None:
             # CSV 読み込み
             self._reader = CsvInputCollection(
@@ -351,7 +710,11 @@ class Table(object):
         ファイルを閉じます。開いていない場合には何もしません。
         """
         if self._reader is not None:
-            del self._reader
+            # 参照カウントによる破棄に任せず、明示的にファイルを閉じる
+            try:
+                self._reader.close()
+            except AttributeError:
+                pass
 
         self._reader = None
 
@@ -361,10 +724,15 @@ class Table(object):
 
         Returns
         -------
-        csv.reader, csv.DictReader
+        csv.reader
             reader オブジェクト。ただし ``open()`` を実行する前は
             ``None`` を返します。
 
+        Notes
+        -----
+        - ``as_dict=True`` で開いた場合も csv.reader を返します。
+          dict への変換は Table から行を読み出す時に行われます。
+
         """
         if self._reader is not None:
             return self._reader.get_reader()
@@ -406,12 +774,12 @@ class Table(object):
         >>> table.save("hachijo_sightseeing_utf8.csv", quoting=csv.QUOTE_ALL)
 
         """
+        _reset_escape_encoding_count()
         with self.open() as reader, \
                 open(path, mode="w", newline="",
                      encoding=encoding, errors="escape_encoding") as f:
             writer = csv.writer(f, **fmtparams)
-            for row in reader:
-                writer.writerow(row)
+            writer.writerows(reader)
 
     def merge(self, target: Union[str, os.PathLike, "Table"]):
         """
@@ -482,32 +850,41 @@ class Table(object):
                         target_table.file))
                 raise RuntimeError("The merged file must be a CSV.")
 
-            cc = target_table._reader._reader  # CSVCleaner
-            target_delimiter = cc.delimiter
-            target_encoding = cc.encoding
+            cc = target_table._reader._reader
+            if target_table.skip_cleaning:
+                # csv.reader の場合は UTF-8 のまま区切り文字だけ合わせる
+                target_delimiter = cc.dialect.delimiter
+            else:
+                # CSVCleaner
+                target_delimiter = cc.delimiter
+                target_encoding = cc.encoding
+
             target_header = target_reader.__next__()
 
         target_table.close()  # 結合先ファイルを書き込み用に一度閉じる
+        _reset_escape_encoding_count()
 
-        # 結合先のファイルに列の順番をそろえる
+        # 結合先のファイルの列の順番にそろえながら、
+        # 一時ファイルを経由せずに直接追加出力する
+        self.open()
+        conv = convertor_find_by("reorder_cols")
+        output = _MergeOutputCollection(
+            target_table.file, target_encoding, target_delimiter)
         try:
-            reordered = self.convert(
-                convertor="reorder_cols",
-                params={"column_list": target_header})
+            with Context(
+                    convertor=conv,
+                    convertor_params={"column_list": target_header},
+                    input=self._reader,
+                    output=output) as context:
+                conv().process(context)
         except ValueError as e:
             logger.error(
                 "結合先のファイルと列を揃える際にエラー。({})".format(
                     e))
             raise ValueError(e)
-
-        # 結合先のファイルに追加出力
-        with reordered.open() as reader, \
-                open(target_table.file, mode="a", newline="",
-                     encoding=target_encoding, errors="escape_encoding") as f:
-            writer = csv.writer(f, delimiter=target_delimiter)
-            reader.__next__()  # ヘッダ行をスキップ
-            for row in reader:
-                writer.writerow(row)
+        finally:
+            self.close()
+            target_table._cached_header = None
 
     def write(
             self,
@@ -550,11 +927,10 @@ class Table(object):
             if skip_header:
                 reader.__next__()
 
-            for n, row in enumerate(reader):
-                if n == lines:
-                    break
-
-                writer.writerow(row)
+            if lines < 0:
+                writer.writerows(reader)
+            else:
+                writer.writerows(islice(reader, lines))
 
     def to_str(self, **kwargs):
         """
@@ -680,7 +1056,8 @@ class Table(object):
           変換結果ファイルが残る場合があります。
         """
         self.open()
-        if output is not None:
+        is_tempfile = output is None
+        if not is_tempfile:
             csv_out = output
         else:
             csv_out = NamedTemporaryFile(
@@ -712,13 +1089,13 @@ class Table(object):
                     self.file, convertor, csv_out))
                 new_table = Table(
                     csv_out,
-                    is_tempfile=(output is None),
+                    is_tempfile=is_tempfile,
                     skip_cleaning=True)
                 return new_table
 
             except RuntimeError as e:
-                if output is None:
-                    os.remove(csv_out)
+                if is_tempfile:
+                    release_tempfile(csv_out)
                     logger.debug((
                         "ファイル '{}' にコンバータ '{}' を適用中、"
                         "エラーのため一時ファイル '{}' を削除しました。").format(
@@ -772,8 +1149,7 @@ class Table(object):
         threshold = 20 if threshold is None else threshold  # デフォルトは 20
 
         # テンプレート CSV の見出し行を取得
-        with template.open() as reader:
-            template_headers = reader.__next__()
+        template_headers = template._get_header()
 
         return self.mapping_with_headers(
             headers=template_headers,
@@ -820,31 +1196,91 @@ class Table(object):
         logger.debug("しきい値： {}".format(threshold))
 
         # 自テーブルの見出し行を取得
-        with self.open() as reader:
-            my_headers = reader.__next__()
+        my_headers = self._get_header()
 
         # 項目マッピング
         pair = ItemsPair(headers, my_headers)
-        mapping = OrderedDict()
-        for result in pair.mapping():
-            output, header, score = result
-            logger.debug("対象列：{}, 対応列：{}, 一致スコア:{:3d}".format(
-                output, header, int(score * 100.0)))
+        mapping = {}
+        debug = logger.isEnabledFor(DEBUG)
+        # ceil(score * 100) < threshold と同じ判定をループの外で準備
+        limit = math.ceil(threshold) - 1
+        for output, header, score in pair.mapping():
+            if debug:
+                logger.debug("対象列：{}, 対応列：{}, 一致スコア:{:3d}".format(
+                    output, header, int(score * 100.0)))
+
             if output is None:
                 # マッピングされなかったカラムは除去
                 continue
 
-            if header is None:
-                mapping[output] = None
-            elif math.ceil(score * 100.0) < threshold:
+            if header is None or score * 100.0 <= limit:
                 mapping[output] = None
             else:
                 mapping[output] = header
 
-        return dict(mapping)
+        return mapping
+
+    def _get_header(self) -> List[str]:
+        """
+        見出し行を返します。
+
+        Notes
+        -----
+        一度読み込んだ見出し行は保持し、 2 回目以降は
+        ファイルを開かずに返します。
+        """
+        if self._cached_header is None:
+            with self.open() as reader:
+                self._cached_header = reader.__next__()
+
+        return list(self._cached_header)
+
+    @classmethod
+    def headers_only(
+            cls,
+            file: os.PathLike,
+            sheet: Optional[str] = None,
+            skip_cleaning: bool = False) -> List[str]:
+        """
+        表データファイルの見出し行だけを読み込みます。
+
+        Parameters
+        ----------
+        file: os.PathLike
+            表データファイルのパス。
+        sheet: str, optional
+            Excel ファイルの場合のシート名。
+        skip_cleaning: bool [default: False]
+            クリーニングをスキップするかどうかを指定するフラグ。
+
+        Returns
+        -------
+        List[str]
+            見出し行の列名のリスト。
+
+        Examples
+        --------
+        >>> from tablelinker import Table
+        >>> headers = Table.headers_only(
+        ...     "sample/datafiles/hachijo_sightseeing.csv")
+        >>> headers[0:4]
+        ['観光スポット名称', '所在地', '緯度', '経度']
+
+        Notes
+        -----
+        - ``skip_cleaning`` に True を指定した場合、
+          Excel の判定やクリーニングを行わず、先頭の 1 レコードだけを
+          UTF-8 の CSV として読み込みます。
+        """
+        if skip_cleaning and isinstance(file, (str, os.PathLike)):
+            with open(file, "r", newline="", encoding="utf-8") as f:
+                return next(csv.reader(f), [])
+
+        table = cls(file, sheet=sheet, skip_cleaning=skip_cleaning)
+        return table._get_header()
 
     @classmethod
-    def fromPandas(cls, df: DataFrame) -> "Table":
+    def fromPandas(cls, df: "pandas.DataFrame") -> "Table":
         r"""
         Pandas DataFrame から Table オブジェクトを作成します。
 
@@ -878,17 +1314,12 @@ class Table(object):
         このメソッドは、一度 DataFrame のすべてのデータを
         CSV ファイル（一時ファイル）に出力します。
         """
-        table = None
         f = NamedTemporaryFile(mode="w+b", delete=False)
-        df.to_csv(f, index=False)
-        table = Table(
-            f.name,
-            is_tempfile=True,
-            skip_cleaning=True)
-
-        return table
+        df.to_csv(f, index=False, encoding="utf-8")
+        f.close()
+        return Table(f.name, is_tempfile=True, skip_cleaning=True)
 
-    def toPandas(self) -> DataFrame:
+    def toPandas(self) -> "pandas.DataFrame":
         r"""
         Table オブジェクトから Pandas DataFrame を作成します。
 
@@ -906,8 +1337,44 @@ class Table(object):
         Index(['国名', '3文字コード'], dtype='object')
 
         """
-        with self.open(as_dict=True, adjust_datatype=True) as reader:
-            df = pd.DataFrame.from_records(reader)
+        import pandas as pd  # 読み込みに時間がかかるので必要な時に読み込む
+
+        with self.open(adjust_datatype=True) as reader:
+            try:
+                headers = reader.__next__()
+            except StopIteration:
+                return pd.DataFrame()
+
+            # 列ごとのリストに値を追加し、最後に DataFrame を作る
+            ncols = len(headers)
+            columns = [[] for _ in range(ncols)]
+            rests = None  # 見出しより多いセルのリスト（csv.DictReader の restkey）
+            nrows = 0
+            for row in reader:
+                if len(row) == 0:
+                    continue  # 空行は読み飛ばす
+
+                if len(row) > ncols:
+                    if rests is None:
+                        rests = [None] * nrows
+
+                    rests.append(row[ncols:])
+                elif rests is not None:
+                    rests.append(None)
+
+                if len(row) < ncols:
+                    row = row + [None] * (ncols - len(row))
+
+                for column, value in zip(columns, row):
+                    column.append(value)
+
+                nrows += 1
+
+        data = {header: column for header, column in zip(headers, columns)}
+        if rests is not None:
+            data[None] = rests
+
+        df = pd.DataFrame(data, copy=False)
 
         return df
 
@@ -954,15 +1421,10 @@ class Table(object):
             logger.error("Polars がインストールされていません。")
             return None
 
-        table = None
         f = NamedTemporaryFile(mode="w+b", delete=False)
-        df.write_csv(f.name)
-        table = Table(
-            f.name,
-            is_tempfile=True,
-            skip_cleaning=True)
-
-        return table
+        df.write_csv(f)
+        f.close()
+        return Table(f.name, is_tempfile=True, skip_cleaning=True)
 
     def toPolars(self):
         r"""
@@ -986,8 +1448,8 @@ class Table(object):
         - Table オブジェクトが明示的にクリーニング不要（skip_cleaning = True）
           な CSV ファイルを参照している場合、 Polars DataFrame も
           直接そのファイルを開きます。
-        - それ以外の場合は、 一度 Table が参照しているすべてのデータを
-          メモリに読み込んでから Polars DataFrame に渡すため、
+        - それ以外の場合は、 一度クリーニングした表データを
+          一時ファイルに保存してから Polars で開くため、
           ファイルサイズが大きい場合には時間がかかることがあります。
 
         """
@@ -1000,11 +1462,18 @@ class Table(object):
         if self.skip_cleaning:
             # クリーニング不要な CSV ファイルを開いている場合、
             # そのまま Polars でファイルを開く。
+            if hasattr(self.file, "seek"):
+                self.file.seek(0)
+
             df = pl.read_csv(self.file)
         else:
-            # メモリに読み込んでから渡す。
-            buffer = io.StringIO()
-            self.write(file=buffer)
-            df = pl.read_csv(buffer)
+            # クリーニングした CSV を一時ファイルに保存して渡す。
+            f = NamedTemporaryFile(delete=False, prefix='table_')
+            f.close()
+            try:
+                self.save(f.name)
+                df = pl.read_csv(f.name)
+            finally:
+                release_tempfile(f.name)
 
         return df
@@ -1,3 +1,4 @@
+import functools
 import json
 from logging import getLogger
 import os
@@ -8,6 +9,28 @@ from .convertors import convertor_find_by
 
 logger = getLogger(__name__)
 
+_TASK_KEYS = frozenset(("convertor", "params", "note",))  # 利用できるキー
+_REQUIRED_TASK_KEYS = ("convertor", "params",)  # 必須のキー
+
+
+@functools.lru_cache(maxsize=None)
+def _get_json_loads():
+    """
+    タスクファイルの解析に利用する関数を返します。
+
+    Notes
+    -----
+    - orjson がインストールされていれば orjson.loads を、
+      そうでなければ json.loads を返します。
+    - orjson はタスクファイルを初めて読み込む時にインポートします。
+    """
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        return json.loads
+
+    return orjson.loads
+
 
 class Task(object):
     """
@@ -32,8 +55,14 @@ class Task(object):
         指定されている場合、変換処理実行時にタスク名をロガーに
         INFO レベルで出力します。
 
+    Notes
+    -----
+    - 文字列表現は作成時の convertor と note から作ります。
+
     """
 
+    __slots__ = ("convertor", "params", "note", "_repr")
+
     def __init__(
             self,
             convertor: str,
@@ -43,13 +72,14 @@ class Task(object):
         self.params = params
         self.note = note
 
-    def __repr__(self):
-        if self.note:
-            return "{}({})".format(
-                self.convertor,
-                self.note)
+        # ログ出力のたびに作らないよう、表記を作っておく
+        if note:
+            self._repr = "{}({})".format(convertor, note)
+        else:
+            self._repr = "{}".format(convertor)
 
-        return "{}".format(self.convertor)
+    def __repr__(self):
+        return self._repr
 
     @classmethod
     def create(cls, task: dict) -> "Task":
@@ -134,20 +164,14 @@ class Task(object):
         if not isinstance(task, dict):
             raise ValueError("タスクが object ではありません。")
 
-        unrecognized_keys = []
-        for key in task.keys():
-            if key not in ("convertor", "params", "note",):
-                unrecognized_keys.append(key)
-
+        unrecognized_keys = [
+            key for key in task if key not in _TASK_KEYS]
         if len(unrecognized_keys) > 0:
             raise ValueError("未定義のキー '{}' が使われています。".format(
                 ",".join(unrecognized_keys)))
 
-        undefined_keys = []
-        for key in ("convertor", "params",):
-            if key not in task:
-                undefined_keys.append(key)
-
+        undefined_keys = [
+            key for key in _REQUIRED_TASK_KEYS if key not in task]
         if len(undefined_keys) > 0:
             raise ValueError("キー '{}' が必要です。".format(
                 ",".join(undefined_keys)))
@@ -212,18 +236,22 @@ class Task(object):
 
         all_tasks = []
         for taskfile in taskfiles:
-            with open(taskfile, 'r') as jsonf:
-                logger.debug("Reading tasks from '{}'.".format(
-                    taskfile))
-                try:
-                    tasks = json.load(jsonf)
-                except json.decoder.JSONDecodeError as e:
-                    logger.error((
-                        "タスクファイル '{}' の JSON 表記が正しくありません。"
-                        "json.decoder.JSONDecodeError: {}").format(
-                            taskfile, e))
-                    raise ValueError("Invalid JSON in '{}'.({})".format(
+            logger.debug("Reading tasks from '{}'.".format(taskfile))
+            with open(taskfile, 'rb') as jsonf:
+                # 先にすべて読み込んでファイルを閉じてから解析する
+                raw = jsonf.read()
+
+            try:
+                # orjson.JSONDecodeError は json.JSONDecodeError の
+                # サブクラスなので、どちらの場合もここで捕捉できる
+                tasks = _get_json_loads()(raw)
+            except json.decoder.JSONDecodeError as e:
+                logger.error((
+                    "タスクファイル '{}' の JSON 表記が正しくありません。"
+                    "json.decoder.JSONDecodeError: {}").format(
                         taskfile, e))
+                raise ValueError("Invalid JSON in '{}'.({})".format(
+                    taskfile, e))
 
             if isinstance(tasks, dict):
                 # コンバータが一つだけ指定されている場合
@@ -1,3 +1,18 @@
+from collections import defaultdict
+import re
+
+# int(), float() で必ず変換できる文字列のパターン
+# (前後の空白と Unicode の数字は int(), float() も受け付ける)
+_INT_RE = re.compile(r"^\s*[-+]?\d+\s*$")
+_FLOAT_RE = re.compile(
+    r"^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
+_DIGIT_RE = re.compile(r"\d")
+# 数字を含まずに float() で変換できる文字列
+_FLOAT_SPECIAL_VALUES = frozenset(("nan", "inf", "infinity"))
+# BooleanValidator が受け付ける値
+_BOOL_VALUES = frozenset((True, False, "false"))
+
+
 class ValidationError(Exception):
     def __init__(self, message, errors):
         super(ValidationError, self).__init__(message)
@@ -5,25 +20,22 @@ class ValidationError(Exception):
 
 
 class Errors(object):
+
+    __slots__ = ("_has_error", "error_messages")
+
     def __init__(self):
         self._has_error = False
-        self.error_messages = {}
+        self.error_messages = defaultdict(list)
 
     def __str__(self):
-        return str(self.error_messages)
+        return str(dict(self.error_messages))
 
     def append(self, message, param=None):
-        key = "none" if param is None else param.key
-
-        if key not in self.error_messages:
-            self.error_messages[key] = []
-
         if param is None:
-            formated_message = message
+            self.error_messages["none"].append(message)
         else:
-            formated_message = "{}は、{}".format(param.label, message)
-
-        self.error_messages[key].append(formated_message)
+            self.error_messages[param.key].append(
+                param.label + "は、" + message)
 
         self._has_error = True
 
@@ -32,6 +44,9 @@ class Errors(object):
 
 
 class Validator(object):
+
+    __slots__ = ()
+
     def valid(self, value, errors, param=None, input=None, output=None):
         pass
 
@@ -45,6 +60,8 @@ class Validator(object):
 class RequiredValidator(Validator):
     REQUIRED_MESSAGE = "必須入力です。"
 
+    __slots__ = ()
+
     def valid(self, value, errors, param=None, input=None, output=None):
         _valid = True
         if value is None or value == "":
@@ -56,12 +73,26 @@ class RequiredValidator(Validator):
 class IntValidator(Validator):
     INT_MESSAGE = "数字を入力してください。"
 
+    __slots__ = ()
+
     def valid(self, value, errors, param=None, input=None, output=None):
 
         if value is None:
             errors.append(self.INT_MESSAGE, param)
             return False
 
+        if isinstance(value, int):
+            return True
+
+        if isinstance(value, str):
+            if _INT_RE.match(value):
+                return True
+
+            if not _DIGIT_RE.search(value):
+                # 数字を含まない文字列は整数に変換できない
+                errors.append(self.INT_MESSAGE, param)
+                return False
+
         try:
             # FIXME
             int(value)
@@ -78,12 +109,20 @@ class IntValidator(Validator):
 class BooleanValidator(Validator):
     BOOLEAN_MESSAGE = "不正な値です。"
 
+    __slots__ = ()
+
     def valid(self, value, errors, param=None, input=None, output=None):
 
         if value is None:
             errors.append(self.BOOLEAN_MESSAGE, param)
             return False
-        if value not in (True, False, "false"):
+
+        try:
+            valid = value in _BOOL_VALUES
+        except TypeError:
+            valid = False  # list などハッシュ化できない値
+
+        if not valid:
             errors.append("{}({})".format(
                 self.BOOLEAN_MESSAGE, str(value)), param)
             return False
@@ -98,7 +137,23 @@ class FloatValidator(Validator):
     FLOAT_MESSAGE = "実数を入力してください。"
     stop_when_error = True
 
+    __slots__ = ()
+
     def valid(self, value, errors, param=None, input=None, output=None):
+        if isinstance(value, (int, float)):
+            return True
+
+        if isinstance(value, str):
+            if _FLOAT_RE.match(value):
+                return True
+
+            if not _DIGIT_RE.search(value) and \
+                    value.strip().lower().lstrip("+-") \
+                    not in _FLOAT_SPECIAL_VALUES:
+                # 数字を含まない文字列は nan, inf 以外は実数に変換できない
+                errors.append(self.FLOAT_MESSAGE, param)
+                return False
+
         _valid = True
         try:
             # FIXME
@@ -117,9 +172,16 @@ class RangeValidator(Validator):
     MAX_MESSAGE = "{max}以下で入力してください。"
     MIN_MESSAGE = "{min}以上で入力してください。"
 
+    __slots__ = ("max", "min", "_max_message", "_min_message")
+
     def __init__(self, max=None, min=None):
         self.max = max
         self.min = min
+        # エラーメッセージは検証のたびに作らず、ここで作っておく
+        self._max_message = None if max is None \
+            else self.MAX_MESSAGE.format(max=max)
+        self._min_message = None if min is None \
+            else self.MIN_MESSAGE.format(min=min)
 
     def _parse(self, value):
         return float(value)
@@ -129,11 +191,11 @@ class RangeValidator(Validator):
             parsed = self._parse(value)
             _valid = True
             if self.max is not None and parsed > self.max:
-                errors.append(self.MAX_MESSAGE.format(max=self.max), param)
+                errors.append(self._max_message, param)
                 _valid = False
 
             if self.min is not None and parsed < self.min:
-                errors.append(self.MIN_MESSAGE.format(min=self.min), param)
+                errors.append(self._min_message, param)
                 _valid = False
             return _valid
         except ValueError:
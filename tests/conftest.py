@@ -1,6 +1,16 @@
 # content of conftest.py
 
+import contextlib
+import os
 from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+
+from tablelinker import Table
+
+sample_dir = Path(__file__).parent.parent / "sample/datafiles"
 
 test_datafiles = (
     'sample/datafiles/2311.xlsx',
@@ -21,19 +31,68 @@ test_generated_files = (
 )
 
 
+# pytest-xdist のワーカーが作業ディレクトリとして使う一時ディレクトリ
+# （元のカレントディレクトリ、一時ディレクトリ）
+_worker_dirs = None
+
+
+def _is_xdist_worker(config):
+    """
+    pytest-xdist (``pytest -n auto``) のワーカープロセスかどうか。
+    ワーカーはそれぞれの一時ディレクトリで実行し、
+    doctest が出力するファイル (tourism.csv など) が
+    他のワーカーのファイルと衝突しないようにする。
+    """
+    return hasattr(config, "workerinput")
+
+
+def _enter_worker_dir(config):
+    """
+    ワーカー用の一時ディレクトリにテストデータへのリンクを作り、
+    カレントディレクトリを移動する。
+    """
+    global _worker_dirs
+
+    root = Path(config.rootpath)
+    workdir = Path(tempfile.mkdtemp(
+        prefix="tablelinker_{}_".format(config.workerinput["workerid"])))
+    for name in ("sample", "templates"):
+        os.symlink(root / name, workdir / name)
+
+    for path in test_datafiles:
+        os.symlink(root / path, workdir / os.path.basename(path))
+
+    _worker_dirs = (os.getcwd(), workdir)
+    os.chdir(workdir)
+
+
+def _leave_worker_dir():
+    """
+    元のカレントディレクトリに戻り、ワーカー用の一時ディレクトリを削除する。
+    """
+    global _worker_dirs
+
+    if _worker_dirs is None:
+        return
+
+    cwd, workdir = _worker_dirs
+    os.chdir(cwd)
+    shutil.rmtree(workdir, ignore_errors=True)
+    _worker_dirs = None
+
+
 def pytest_configure(config):
     """
     Allows plugins and conftest files to perform initial configuration.
     This hook is called for every plugin and initial conftest
     file after command line options have been parsed.
     """
+    if _is_xdist_worker(config):
+        return
+
     for path in test_datafiles:
-        link_to = Path(path)
-        link_from = Path(link_to.name)
-        try:
-            link_from.symlink_to(link_to)
-        except FileExistsError:
-            pass
+        with contextlib.suppress(FileExistsError):
+            os.symlink(path, os.path.basename(path))
 
 
 def pytest_sessionstart(session):
@@ -43,6 +102,16 @@ def pytest_sessionstart(session):
     """
 
 
+def pytest_collection_finish(session):
+    """
+    Called after collection has been performed and modified.
+    """
+    # コマンドラインで指定した相対パスは収集時にカレントディレクトリから
+    # 解決されるので、ワーカーの作業ディレクトリへは収集後に移動する
+    if _is_xdist_worker(session.config):
+        _enter_worker_dir(session.config)
+
+
 def pytest_sessionfinish(session, exitstatus):
     """
     Called after whole test run finished, right before
@@ -54,13 +123,46 @@ def pytest_unconfigure(config):
     """
     called before test process is exited.
     """
+    if _is_xdist_worker(config):
+        _leave_worker_dir()
+        return
+
     for path in test_datafiles:
-        link_to = Path(path)
-        link_from = Path(link_to.name)
-        link_from.unlink()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(os.path.basename(path))
 
     for path in test_generated_files:
-        try:
-            Path(path).unlink()
-        except FileNotFoundError:
-            pass
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+# サンプルファイルのパスはテストセッション全体で共有し、
+# 状態を持つ Table はテストごとに作り直す
+@pytest.fixture(scope="session")
+def sample_files():
+    return {
+        "ma030000": sample_dir / "ma030000.csv",
+        "yanai_tourism_sjis": sample_dir / "yanai_tourism_sjis.csv",
+        "hachijo_sightseeing": sample_dir / "hachijo_sightseeing.csv",
+        "hachijo_sightseeing_xlsx": sample_dir / "hachijo_sightseeing.xlsx",
+    }
+
+
+@pytest.fixture
+def ma030000_table(sample_files):
+    return Table(sample_files["ma030000"])
+
+
+@pytest.fixture
+def yanai_tourism_sjis_table(sample_files):
+    return Table(sample_files["yanai_tourism_sjis"])
+
+
+@pytest.fixture
+def hachijo_sightseeing_table(sample_files):
+    return Table(sample_files["hachijo_sightseeing"])
+
+
+@pytest.fixture
+def hachijo_sightseeing_xlsx_table(sample_files):
+    return Table(sample_files["hachijo_sightseeing_xlsx"])
@@ -1,16 +1,42 @@
-from pathlib import Path
 import re
 
 import pytest
 
 from tablelinker import Table
 
-sample_dir = Path(__file__).parent.parent / "sample/datafiles"
-
-
-def test_calc_col():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+# 半角数字とハイフンだけの文字列
+_HANKAKU_NUMBER_RE = re.compile(r'^[0-9\-]*$')
+# 半角数字とハイフンを含まない文字列
+_NO_HANKAKU_NUMBER_RE = re.compile(r'^[^0-9\-]*$')
+# delete_row_pattern で削除されるべき地域名（空欄、区部、市）
+_DELETED_AREA_RE = re.compile(r'^$|区部$|市$')
+# 先頭が半角数字の文字列
+_LEADING_NUMBER_RE = re.compile(r'^[0-9]')
+
+# 変換前の ma030000.csv の見出し行
+_MA030000_HEADER = [
+    "", "人口", "出生数", "死亡数", "（再掲）", "", "自　然", "死産数",
+    "", "", "周産期死亡数", "", "", "婚姻件数", "離婚件数"]
+# ma030000.csv の見出しを concat_title で結合した見出し行
+_MA030000_CONCAT_TITLE_HEADER = [
+    "", "人口", "出生数", "死亡数", "（再掲）乳児死亡数",
+    "（再掲）新生児死亡数", "自　然増減数", "死産数総数",
+    "死産数自然死産", "死産数人工死産", "周産期死亡数総数",
+    "周産期死亡数22週以後の死産数", "周産期死亡数早期新生児死亡数",
+    "婚姻件数", "離婚件数"]
+# ma030000.csv の「全　国」の行
+_MA030000_ZENKOKU_ROW = [
+    "全　国", "123398962", "840835", "1372755", "1512", "704",
+    "-531920", "17278", "8188", "9090", "2664", "2112", "552",
+    "525507", "193253"]
+# 変換前の hachijo_sightseeing.csv の見出し行
+_HACHIJO_SIGHTSEEING_HEADER = [
+    "観光スポット名称", "所在地", "緯度", "経度", "座標系", "説明",
+    "八丈町ホームページ記載"]
+
+
+def test_calc_col(ma030000_table):
+    table = ma030000_table.convert(
         convertor="calc",
         params={
             "input_col_idx1": "出生数",
@@ -22,22 +48,19 @@ def test_calc_col():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 16
-            if lineno == 0:
-                # ヘッダに「出生率（計算）」が追加されていることを確認
-                assert ",".join(row) == (
-                    ',人口,出生数,死亡数,（再掲）,,自　然,死産数,,,'
-                    '周産期死亡数,,,婚姻件数,離婚件数,出生率（計算）')
+        # ヘッダに「出生率（計算）」が追加されていることを確認
+        header = next(reader)
+        assert len(header) == 16
+        assert header == _MA030000_HEADER + ["出生率（計算）"]
+        rows = list(reader)
 
-            elif lineno == 4:
-                # 計算結果が正しいことを確認
-                assert abs(float(row[-1]) - 0.00569) < 1.0e-6
+    assert all(len(row) == 16 for row in rows)
+    # 計算結果が正しいことを確認
+    assert abs(float(rows[3][-1]) - 0.00569) < 1.0e-6
 
 
-def test_concat_col():
-    table = Table(sample_dir / "yanai_tourism_sjis.csv")
-    table = table.convert(
+def test_concat_col(yanai_tourism_sjis_table):
+    table = yanai_tourism_sjis_table.convert(
         convertor="concat_col",
         params={
             "input_col_idx1": "都道府県名",
@@ -49,27 +72,26 @@ def test_concat_col():
     )
 
     with table.open(as_dict=True) as dictreader:
-        for lineno, row in enumerate(dictreader):
+        # ヘッダの「名称」列の前に「自治体名」が追加される
+        row = next(dictreader)
+        assert len(row) == 31
+        assert list(row) == [
+            "市区町村コード", "NO", "都道府県名", "市区町村名", "自治体名",
+            "名称", "名称_カナ", "名称_英語", "POIコード", "住所", "方書",
+            "緯度", "経度", "利用可能曜日", "開始時間", "終了時間",
+            "利用可能日時特記事項", "料金(基本)", "料金(詳細)", "説明",
+            "説明_英語", "アクセス方法", "駐車場情報", "バリアフリー情報",
+            "連絡先名称", "連絡先電話番号", "連絡先内線番号", "画像",
+            "画像_ライセンス", "URL", "備考"]
+
+        for row in dictreader:
             assert len(row) == 31
-            if lineno == 0:
-                # ヘッダの「名称」列の前に「自治体名」が追加される
-                assert ",".join(row) == (
-                    "市区町村コード,NO,都道府県名,市区町村名,自治体名,名称,"
-                    "名称_カナ,名称_英語,POIコード,住所,方書,緯度,経度,"
-                    "利用可能曜日,開始時間,終了時間,利用可能日時特記事項,"
-                    "料金(基本),料金(詳細),説明,説明_英語,アクセス方法,"
-                    "駐車場情報,バリアフリー情報,連絡先名称,連絡先電話番号,"
-                    "連絡先内線番号,画像,画像_ライセンス,URL,備考"
-                )
-
-            elif lineno > 0:
-                # 結合結果を確認
-                assert row["自治体名"] == "山口県 柳井市"
-
-
-def test_concat_cols():
-    table = Table(sample_dir / "yanai_tourism_sjis.csv")
-    table = table.convert(
+            # 結合結果を確認
+            assert row["自治体名"] == "山口県 柳井市"
+
+
+def test_concat_cols(yanai_tourism_sjis_table):
+    table = yanai_tourism_sjis_table.convert(
         convertor="concat_cols",
         params={
             "input_col_idxs": [
@@ -82,30 +104,29 @@ def test_concat_cols():
     )
 
     with table.open(as_dict=True) as dictreader:
-        for lineno, row in enumerate(dictreader):
+        # ヘッダの「画像」列の前に「連絡先情報」が追加される
+        row = next(dictreader)
+        assert len(row) == 31
+        assert list(row) == [
+            "市区町村コード", "NO", "都道府県名", "市区町村名", "名称",
+            "名称_カナ", "名称_英語", "POIコード", "住所", "方書", "緯度",
+            "経度", "利用可能曜日", "開始時間", "終了時間",
+            "利用可能日時特記事項", "料金(基本)", "料金(詳細)", "説明",
+            "説明_英語", "アクセス方法", "駐車場情報", "バリアフリー情報",
+            "連絡先名称", "連絡先電話番号", "連絡先内線番号", "連絡先情報",
+            "画像", "画像_ライセンス", "URL", "備考"]
+
+        for row in dictreader:
             assert len(row) == 31
-            if lineno == 0:
-                # ヘッダの「画像」列の前に「連絡先情報」が追加される
-                assert ",".join(row) == (
-                    "市区町村コード,NO,都道府県名,市区町村名,名称,"
-                    "名称_カナ,名称_英語,POIコード,住所,方書,緯度,経度,"
-                    "利用可能曜日,開始時間,終了時間,利用可能日時特記事項,"
-                    "料金(基本),料金(詳細),説明,説明_英語,アクセス方法,"
-                    "駐車場情報,バリアフリー情報,連絡先名称,連絡先電話番号,"
-                    "連絡先内線番号,連絡先情報,画像,画像_ライセンス,URL,備考"
-                )
-
-            elif lineno > 0:
-                # 結合結果を確認
-                assert row["連絡先情報"] == ";".join([
-                    row["連絡先名称"],
-                    row["連絡先電話番号"],
-                    row["連絡先内線番号"]])
-
-
-def test_concat_title():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+            # 結合結果を確認
+            assert row["連絡先情報"] == ";".join([
+                row["連絡先名称"],
+                row["連絡先電話番号"],
+                row["連絡先内線番号"]])
+
+
+def test_concat_title(ma030000_table):
+    table = ma030000_table.convert(
         convertor="concat_title",
         params={
             "title_lines": 3,
@@ -116,26 +137,19 @@ def test_concat_title():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 15
-            if lineno == 0:
-                # ヘッダ確認
-                assert ",".join(row) == (
-                    ",人口,出生数,死亡数,（再掲）乳児死亡数,"
-                    "（再掲）新生児死亡数,自　然増減数,"
-                    "死産数総数,死産数自然死産,死産数人工死産,"
-                    "周産期死亡数総数,周産期死亡数22週以後の死産数,"
-                    "周産期死亡数早期新生児死亡数,婚姻件数,離婚件数")
-            elif lineno == 1:
-                # 最初のデータ行を確認
-                assert ",".join(row) == (
-                    "全　国,123398962,840835,1372755,1512,704,"
-                    "-531920,17278,8188,9090,2664,2112,552,525507,193253")
-
-
-def test_concat_title_data_from():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+        # ヘッダ確認
+        header = next(reader)
+        assert len(header) == 15
+        assert header == _MA030000_CONCAT_TITLE_HEADER
+        rows = list(reader)
+
+    assert all(len(row) == 15 for row in rows)
+    # 最初のデータ行を確認
+    assert rows[0] == _MA030000_ZENKOKU_ROW
+
+
+def test_concat_title_data_from(ma030000_table):
+    table = ma030000_table.convert(
         convertor="concat_title",
         params={
             "data_from": "全　国",
@@ -146,26 +160,19 @@ def test_concat_title_data_from():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 15
-            if lineno == 0:
-                # ヘッダ確認
-                assert ",".join(row) == (
-                    ",人口,出生数,死亡数,（再掲）乳児死亡数,"
-                    "（再掲）新生児死亡数,自　然増減数,"
-                    "死産数総数,死産数自然死産,死産数人工死産,"
-                    "周産期死亡数総数,周産期死亡数22週以後の死産数,"
-                    "周産期死亡数早期新生児死亡数,婚姻件数,離婚件数")
-            elif lineno == 1:
-                # 最初のデータ行を確認
-                assert ",".join(row) == (
-                    "全　国,123398962,840835,1372755,1512,704,"
-                    "-531920,17278,8188,9090,2664,2112,552,525507,193253")
-
-
-def test_delete_col():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+        # ヘッダ確認
+        header = next(reader)
+        assert len(header) == 15
+        assert header == _MA030000_CONCAT_TITLE_HEADER
+        rows = list(reader)
+
+    assert all(len(row) == 15 for row in rows)
+    # 最初のデータ行を確認
+    assert rows[0] == _MA030000_ZENKOKU_ROW
+
+
+def test_delete_col(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="delete_col",
         params={
             "input_col_idx": "座標系",
@@ -173,26 +180,24 @@ def test_delete_col():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 6
-            if lineno == 0:
-                # ヘッダに「座標系」が存在しないことを確認
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,緯度,経度,"
-                    "説明,八丈町ホームページ記載")
-
-            elif lineno == 1:
-                # レコードから座標系列が削除されていることを確認
-                assert ",".join(row[0:4]) == "ホタル水路,,33.108218,139.80102"
-                assert row[4].startswith("八丈島は伊豆諸島で唯一、")
-                assert row[5] == (
-                    "http://www.town.hachijo.tokyo.jp/kankou_spot/"
-                    "mitsune.html#01")
-
-
-def test_delete_row_match():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+        # ヘッダに「座標系」が存在しないことを確認
+        header = next(reader)
+        assert len(header) == 6
+        assert header == [
+            "観光スポット名称", "所在地", "緯度", "経度", "説明",
+            "八丈町ホームページ記載"]
+        rows = list(reader)
+
+    assert all(len(row) == 6 for row in rows)
+    # レコードから座標系列が削除されていることを確認
+    assert rows[0][0:4] == ["ホタル水路", "", "33.108218", "139.80102"]
+    assert rows[0][4].startswith("八丈島は伊豆諸島で唯一、")
+    assert rows[0][5] == (
+        "http://www.town.hachijo.tokyo.jp/kankou_spot/mitsune.html#01")
+
+
+def test_delete_row_match(ma030000_table):
+    table = ma030000_table.convert(
         convertor="delete_row_match",
         params={
             "input_col_idx": 0,
@@ -201,21 +206,19 @@ def test_delete_row_match():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
+        header = next(reader)
+        assert len(header) == 15  # 列数チェック
+        lines = 1
+        for lines, row in enumerate(reader, start=2):
             assert len(row) == 15  # 列数チェック
-            if lines > 0:
-                assert row[0] != ""   # "" の行は削除
-
-            lines += 1
+            assert row[0] != ""   # "" の行は削除
 
         # 出力行数をチェック
         assert lines == 72
 
 
-def test_delete_row_contains():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_delete_row_contains(ma030000_table):
+    table = ma030000_table.convert(
         convertor="delete_row_contains",
         params={
             "input_col_idx": 0,
@@ -224,21 +227,20 @@ def test_delete_row_contains():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
-            assert len(row) == 15
-            if lines > 0:
-                assert "市" not in row[0]
+        header = next(reader)
+        assert len(header) == 15
+        rows = list(reader)
 
-            lines += 1
+    assert all(len(row) == 15 for row in rows)
+    # 改行は地域名に含まれないので、連結して一度に検索する
+    assert "市" not in "\n".join(row[0] for row in rows)
 
     # 出力行数をチェック
-    assert lines == 54
+    assert len(rows) + 1 == 54
 
 
-def test_delete_row_pattern():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_delete_row_pattern(ma030000_table):
+    table = ma030000_table.convert(
         convertor="delete_row_pattern",
         params={
             "input_col_idx": 0,
@@ -247,23 +249,19 @@ def test_delete_row_pattern():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
-            assert len(row) == 15
-            if lines > 0:
-                assert row[0] != ""
-                assert not row[0].endswith("区部")
-                assert not row[0].endswith("市")
+        header = next(reader)
+        assert len(header) == 15
+        rows = list(reader)
 
-            lines += 1
+    assert all(len(row) == 15 for row in rows)
+    assert not any(_DELETED_AREA_RE.search(row[0]) for row in rows)
 
     # 出力行数をチェック
-    assert lines == 51
+    assert len(rows) + 1 == 51
 
 
-def test_generate_pk():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_generate_pk(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="generate_pk",
         params={
             "input_col_idx": "観光スポット名称",
@@ -273,24 +271,24 @@ def test_generate_pk():
     )
 
     with table.open() as reader:
-        keys = {}
-        for lineno, row in enumerate(reader):
+        # 先頭列に「pk」が追加されていることを確認
+        header = next(reader)
+        assert len(header) == 8
+        assert header == ["pk"] + _HACHIJO_SIGHTSEEING_HEADER
+
+        keys = []
+        for row in reader:
             assert len(row) == 8
-            if lineno == 0:
-                # 先頭列に「pk」が追加されていることを確認
-                assert ",".join(row) == (
-                    "pk,観光スポット名称,所在地,緯度,経度,"
-                    "座標系,説明,八丈町ホームページ記載")
+            # pk 欄には 6 文字のキー文字列
+            assert len(row[0]) == 6
+            keys.append(row[0])
 
-            else:
-                # pk 欄には一意のキー文字列
-                assert len(row[0]) == 6
-                assert row[0] not in keys
-                keys[row[0]] = True
+        # キーは一意
+        assert len(set(keys)) == len(keys)
 
 
-def test_generate_pk_not_unique():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
+def test_generate_pk_not_unique(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table
 
     with pytest.raises(ValueError):
         table = table.convert(
@@ -314,27 +312,23 @@ def test_generate_pk_not_unique():
     )
 
     with table.open() as reader:
-        keys = {}
-        for lineno, row in enumerate(reader):
-            assert len(row) == 8
-            if lineno == 0:
-                # 先頭列に「pk」が追加されていることを確認
-                assert ",".join(row) == (
-                    "pk,観光スポット名称,所在地,緯度,経度,"
-                    "座標系,説明,八丈町ホームページ記載")
+        # 先頭列に「pk」が追加されていることを確認
+        header = next(reader)
+        assert len(header) == 8
+        assert header == ["pk"] + _HACHIJO_SIGHTSEEING_HEADER
 
-            else:
-                # pk 欄には一意のキー文字列
-                assert len(row[0]) == 6
-                assert row[0] not in keys
-                keys[row[0]] = True
+        keys = []
+        for row in reader:
+            assert len(row) == 8
+            # pk 欄には 6 文字のキー文字列
+            assert len(row[0]) == 6
+            keys.append(row[0])
 
-        assert lineno == 1  # 先頭の行以外はスキップされる
+        assert len(keys) == 1  # 先頭の行以外はスキップされる
 
 
-def test_insert_col():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_insert_col(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="insert_col",
         params={
             "output_col_idx": "所在地",
@@ -344,22 +338,21 @@ def test_insert_col():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 8
-            if lineno == 0:
-                # 「所在地」の前に「都道府県名」が追加されていることを確認
-                assert ",".join(row) == (
-                    "観光スポット名称,都道府県名,所在地,緯度,経度,"
-                    "座標系,説明,八丈町ホームページ記載")
+        # 「所在地」の前に「都道府県名」が追加されていることを確認
+        header = next(reader)
+        assert len(header) == 8
+        assert header == [
+            "観光スポット名称", "都道府県名", "所在地", "緯度", "経度",
+            "座標系", "説明", "八丈町ホームページ記載"]
 
-            else:
-                # 都道府県名欄に「東京都」が追加されていることを確認
-                assert row[1] == "東京都"
+        for row in reader:
+            assert len(row) == 8
+            # 都道府県名欄に「東京都」が追加されていることを確認
+            assert row[1] == "東京都"
 
 
-def test_insert_cols():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_insert_cols(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="insert_cols",
         params={
             "output_col_idx": "所在地",
@@ -369,25 +362,24 @@ def test_insert_cols():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
+        # 「所在地」の前に「都道府県名」「市区町村名」が
+        # 追加されていることを確認
+        header = next(reader)
+        assert len(header) == 9
+        assert header == [
+            "観光スポット名称", "都道府県名", "市区町村名", "所在地", "緯度",
+            "経度", "座標系", "説明", "八丈町ホームページ記載"]
+
+        for row in reader:
             assert len(row) == 9
-            if lineno == 0:
-                # 「所在地」の前に「都道府県名」「市区町村名」が
-                # 追加されていることを確認
-                assert ",".join(row) == (
-                    "観光スポット名称,都道府県名,市区町村名,所在地,"
-                    "緯度,経度,座標系,説明,八丈町ホームページ記載")
-
-            else:
-                # 都道府県名欄に「東京都」が追加されていることを確認
-                assert row[1] == "東京都"
-                # 市区町村名に「八丈町」が追加されていることを確認
-                assert row[2] == "八丈町"
-
-
-def test_mapping_cols():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+            # 都道府県名欄に「東京都」が追加されていることを確認
+            assert row[1] == "東京都"
+            # 市区町村名に「八丈町」が追加されていることを確認
+            assert row[2] == "八丈町"
+
+
+def test_mapping_cols(ma030000_table):
+    table = ma030000_table.convert(
         convertor="mapping_cols",
         params={
             "column_map": {
@@ -400,21 +392,19 @@ def test_mapping_cols():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 4
-            if lineno == 0:
-                # ヘッダを確認
-                assert ",".join(row) == "都道府県,人口,婚姻件数,離婚件数"
+        # ヘッダを確認
+        header = next(reader)
+        assert len(header) == 4
+        assert header == ["都道府県", "人口", "婚姻件数", "離婚件数"]
+        rows = list(reader)
 
-            elif lineno == 4:
-                # 列の値が正しくマップされていることを確認
-                assert row == ["01 北海道", "5188441", "20904", "9070"]
-                break
+    assert all(len(row) == 4 for row in rows)
+    # 列の値が正しくマップされていることを確認
+    assert rows[3] == ["01 北海道", "5188441", "20904", "9070"]
 
 
-def test_move_col():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_move_col(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="move_col",
         params={
             "input_col_idx": "経度",
@@ -423,23 +413,22 @@ def test_move_col():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 7
-            if lineno == 0:
-                # ヘッダの順番が「経度」「緯度」に入れ替わっていることを確認
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,経度,緯度,"
-                    "座標系,説明,八丈町ホームページ記載")
-
-            elif lineno == 1:
-                # 緯度と経度が入れ替わっていることを確認
-                assert row[2] == "139.80102"
-                assert row[3] == "33.108218"
-
-
-def test_rename_col():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+        # ヘッダの順番が「経度」「緯度」に入れ替わっていることを確認
+        header = next(reader)
+        assert len(header) == 7
+        assert header == [
+            "観光スポット名称", "所在地", "経度", "緯度", "座標系", "説明",
+            "八丈町ホームページ記載"]
+        rows = list(reader)
+
+    assert all(len(row) == 7 for row in rows)
+    # 緯度と経度が入れ替わっていることを確認
+    assert rows[0][2] == "139.80102"
+    assert rows[0][3] == "33.108218"
+
+
+def test_rename_col(ma030000_table):
+    table = ma030000_table.convert(
         convertor="rename_col",
         params={
             "input_col_idx": 0,
@@ -448,18 +437,15 @@ def test_rename_col():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 15
-            if lineno == 0:
-                # 0列目のヘッダが「都道府県名」に変更されていることを確認
-                assert ",".join(row) == (
-                    "都道府県名,人口,出生数,死亡数,（再掲）,,自　然,死産数,,,"
-                    "周産期死亡数,,,婚姻件数,離婚件数")
+        # 0列目のヘッダが「都道府県名」に変更されていることを確認
+        header = next(reader)
+        assert len(header) == 15
+        assert header == ["都道府県名"] + _MA030000_HEADER[1:]
+        assert all(len(row) == 15 for row in reader)
 
 
-def test_reorder_cols():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_reorder_cols(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="reorder_cols",
         params={
             "column_list": [
@@ -472,15 +458,12 @@ def test_reorder_cols():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 4
-            if lineno == 0:
-                assert row == ["所在地", "経度", "緯度", "説明"]
+        assert next(reader) == ["所在地", "経度", "緯度", "説明"]
+        assert all(len(row) == 4 for row in reader)
 
 
-def test_select_row_match():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_select_row_match(ma030000_table):
+    table = ma030000_table.convert(
         convertor="select_row_match",
         params={
             "input_col_idx": 0,
@@ -489,20 +472,18 @@ def test_select_row_match():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
+        header = next(reader)
+        assert len(header) == 15
+        lines = 1
+        for lines, row in enumerate(reader, start=2):
             assert len(row) == 15
-            if lines > 0:
-                assert row[0] == "13 東京都"
-
-            lines += 1
+            assert row[0] == "13 東京都"
 
         assert lines == 2
 
 
-def test_select_row_contains():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_select_row_contains(ma030000_table):
+    table = ma030000_table.convert(
         convertor="select_row_contains",
         params={
             "input_col_idx": 0,
@@ -511,20 +492,18 @@ def test_select_row_contains():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
+        header = next(reader)
+        assert len(header) == 15
+        lines = 1
+        for lines, row in enumerate(reader, start=2):
             assert len(row) == 15
-            if lines > 0:
-                assert row[0] in ("13 東京都", "50 東京都の区部",)
-
-            lines += 1
+            assert row[0] in ("13 東京都", "50 東京都の区部",)
 
         assert lines == 3
 
 
-def test_select_row_pattern():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_select_row_pattern(ma030000_table):
+    table = ma030000_table.convert(
         convertor="select_row_pattern",
         params={
             "input_col_idx": 0,
@@ -533,20 +512,18 @@ def test_select_row_pattern():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
+        header = next(reader)
+        assert len(header) == 15
+        lines = 1
+        for lines, row in enumerate(reader, start=2):
             assert len(row) == 15
-            if lines > 0:
-                assert row[0] == "13 東京都"
-
-            lines += 1
+            assert row[0] == "13 東京都"
 
         assert lines == 2
 
 
-def test_split_col():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_split_col(ma030000_table):
+    table = ma030000_table.convert(
         convertor="split_col",
         params={
             "input_col_idx": 0,
@@ -561,18 +538,15 @@ def test_split_col():
         最初の列にしかアクセスできない点に注意。
         列数もその分減少する（15 -> 10）。
         """
-        lines = 0
+        row = next(dictreader)
+        assert len(row) == 12  # "コード", "地域名" の2列追加
         for row in dictreader:
-            assert len(row) == 12  # "コード", "地域名" の2列追加
-            if lines > 0:
-                assert " " not in row["コード"]
+            assert len(row) == 12
+            assert " " not in row["コード"]
 
-            lines += 1
 
-
-def test_split_row():
-    table = Table(sample_dir / "yanai_tourism_sjis.csv")
-    table = table.convert(
+def test_split_row(yanai_tourism_sjis_table):
+    table = yanai_tourism_sjis_table.convert(
         convertor="split_row",
         params={
             "input_col_idx": "アクセス方法",
@@ -582,17 +556,15 @@ def test_split_row():
 
     with table.open(as_dict=True) as dictreader:
         lines = 0
-        for row in dictreader:
+        for lines, row in enumerate(dictreader, start=1):
             assert len(row) == 30  # 列数は変わらない
             assert "。" not in row["アクセス方法"]
-            lines += 1
 
         assert lines == 51  # 列に分割するので増える
 
 
-def test_truncate():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_truncate(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="truncate",
         params={
             "input_col_idx": "説明",
@@ -603,24 +575,21 @@ def test_truncate():
     )
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 7
-            if lineno == 0:
-                # 「説明」列は overwrite するので元の位置
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,緯度,経度,座標系,"
-                    "説明,八丈町ホームページ記載")
-                continue
+        # 「説明」列は overwrite するので元の位置
+        header = next(reader)
+        assert len(header) == 7
+        assert header == _HACHIJO_SIGHTSEEING_HEADER
 
+        for row in reader:
+            assert len(row) == 7
             # レコードの最後列が切り詰められていることを確認
             value = row[5]
             if len(value) > 20:
                 assert value.endswith("...")
 
 
-def test_truncate_replace():
-    table = Table(sample_dir / "hachijo_sightseeing.csv")
-    table = table.convert(
+def test_truncate_replace(hachijo_sightseeing_table):
+    table = hachijo_sightseeing_table.convert(
         convertor="truncate",
         params={
             "input_col_idx": "説明",
@@ -632,24 +601,21 @@ def test_truncate_replace():
     )
 
     with table.open(as_dict=True) as dictreader:
-        for lineno, row in enumerate(dictreader):
-            assert len(row) == 7
-            if lineno == 0:
-                # 「説明」列は元の場所に残る
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,緯度,経度,座標系,"
-                    "説明,八丈町ホームページ記載")
-                continue
+        # 「説明」列は元の場所に残る
+        row = next(dictreader)
+        assert len(row) == 7
+        assert list(row) == _HACHIJO_SIGHTSEEING_HEADER
 
+        for row in dictreader:
+            assert len(row) == 7
             # 説明列が切り詰められていることを確認
             value = row["説明"]
             if len(value) > 20:
                 assert value.endswith("...")
 
 
-def test_update_row_match():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_update_row_match(ma030000_table):
+    table = ma030000_table.convert(
         convertor="update_col_match",
         params={
             "input_col_idx": 0,
@@ -659,19 +625,15 @@ def test_update_row_match():
     )
 
     with table.open() as reader:
-        lines = 0
-        for lineno, row in enumerate(reader):
-            assert len(row) == 15
-            lines += 1
-            if lineno == 3:
-                assert row[0] == "全国"
+        rows = list(reader)
 
-        assert lines == 74
+    assert all(len(row) == 15 for row in rows)
+    assert rows[3][0] == "全国"
+    assert len(rows) == 74
 
 
-def test_update_row_contains():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_update_row_contains(ma030000_table):
+    table = ma030000_table.convert(
         convertor="update_col_contains",
         params={
             "input_col_idx": 0,
@@ -681,20 +643,18 @@ def test_update_row_contains():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
-            assert len(row) == 15
-            if lines > 0:
-                assert "　" not in row[0]
+        header = next(reader)
+        assert len(header) == 15
+        rows = list(reader)
 
-            lines += 1
+    assert all(len(row) == 15 for row in rows)
+    # 改行は地域名に含まれないので、連結して一度に検索する
+    assert "　" not in "\n".join(row[0] for row in rows)
+    assert len(rows) + 1 == 74
 
-        assert lines == 74
 
-
-def test_update_row_pattern():
-    table = Table(sample_dir / "ma030000.csv")
-    table = table.convert(
+def test_update_row_pattern(ma030000_table):
+    table = ma030000_table.convert(
         convertor="update_col_pattern",
         params={
             "input_col_idx": 0,
@@ -704,15 +664,13 @@ def test_update_row_pattern():
     )
 
     with table.open() as reader:
-        lines = 0
-        for row in reader:
-            assert len(row) == 15
-            if lines > 0:
-                assert row[0] == '' or row[0][0] not in '0123456789'
+        header = next(reader)
+        assert len(header) == 15
+        rows = list(reader)
 
-            lines += 1
-
-        assert lines == 74
+    assert all(len(row) == 15 for row in rows)
+    assert not any(_LEADING_NUMBER_RE.match(row[0]) for row in rows)
+    assert len(rows) + 1 == 74
 
 
 def test_to_hankaku():
@@ -734,7 +692,7 @@ def test_to_hankaku():
             assert len(row) == 3
             if lineno > 0:
                 # 「連絡先電話番号」列は半角文字に変換
-                assert re.match(r'^[0-9\-]*$', row["連絡先電話番号"])
+                assert _HANKAKU_NUMBER_RE.match(row["連絡先電話番号"])
 
 
 def test_to_zenkaku():
@@ -756,139 +714,63 @@ def test_to_zenkaku():
             assert len(row) == 2
             if lineno > 0:
                 # 「所在地」列は全角文字に変換
-                assert re.match(r'^[^0-9\-]*$', row["所在地"])
-
-
-def test_input_output_convertor1():
-    """
-    InputOutputConverter のテスト。
-
-    出力列名も出力位置も指定しない場合は
-    既存列の位置にそのまま上書きする。
-    """
-    data = (
-        "col0,col1,col2,col3\n"
-        "00,01,02,03\n"
-        "10,11,12,13\n"
-        "20,21,22,23\n")
-    table = Table(data=data).convert(
-        convertor="round",
-        params={
-            "input_col_idx": "col0",
-            "overwrite": True,
-        })
-
-    with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 4
-            if lineno == 0:
-                assert row == ["col0", "col1", "col2", "col3"]
-
-
-def test_input_output_convertor2():
-    """
-    InputOutputConverter のテスト。
-
-    出力位置だけ指定した場合、既存列を削除して
-    指定した位置に出力する。
-    """
-    data = (
-        "col0,col1,col2,col3\n"
-        "00,01,02,03\n"
-        "10,11,12,13\n"
-        "20,21,22,23\n")
-    table = Table(data=data).convert(
-        convertor="round",
-        params={
-            "input_col_idx": "col1",
-            "overwrite": True,
-            "output_col_idx": 3,
-        })
-
-    with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 4
-            if lineno == 0:
-                assert row == ["col0", "col2", "col1", "col3"]
-
-
-def test_input_output_convertor3():
-    """
-    InputOutputConverter のテスト。
-
-    出力位置だけ指定した場合、既存列を削除して
-    指定した位置に出力する。
-    出力位置を列数以上に指定した場合、最後尾に追加する。
-    """
-    data = (
-        "col0,col1,col2,col3\n"
-        "00,01,02,03\n"
-        "10,11,12,13\n"
-        "20,21,22,23\n")
-    table = Table(data=data).convert(
-        convertor="round",
-        params={
-            "input_col_idx": "col1",
-            "overwrite": True,
-            "output_col_idx": 99,
-        })
-
-    with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 4
-            if lineno == 0:
-                assert row == ["col0", "col2", "col3", "col1"]
-
-
-def test_input_output_convertor4():
+                assert _NO_HANKAKU_NUMBER_RE.match(row["所在地"])
+
+
+# InputOutputConverter のテストに使う表
+_INPUT_OUTPUT_DATA = (
+    "col0,col1,col2,col3\n"
+    "00,01,02,03\n"
+    "10,11,12,13\n"
+    "20,21,22,23\n")
+
+
+@pytest.mark.parametrize("params,expected_header", [
+    # 出力列名も出力位置も指定しない場合は
+    # 既存列の位置にそのまま上書きする。
+    ({
+        "input_col_idx": "col0",
+        "overwrite": True,
+    }, ["col0", "col1", "col2", "col3"]),
+    # 出力位置だけ指定した場合、既存列を削除して
+    # 指定した位置に出力する。
+    ({
+        "input_col_idx": "col1",
+        "overwrite": True,
+        "output_col_idx": 3,
+    }, ["col0", "col2", "col1", "col3"]),
+    # 出力位置を列数以上に指定した場合、最後尾に追加する。
+    ({
+        "input_col_idx": "col1",
+        "overwrite": True,
+        "output_col_idx": 99,
+    }, ["col0", "col2", "col3", "col1"]),
+    # 出力列名を指定し、出力先を指定しない場合は、
+    # 新規列を最後尾に追加する。
+    ({
+        "input_col_idx": "col1",
+        "output_col_name": "col1+",
+        "overwrite": False,
+    }, ["col0", "col1", "col2", "col3", "col1+"]),
+    # 出力列名も出力先も指定した場合は、
+    # 新規列を指定した位置に挿入する。
+    ({
+        "input_col_idx": "col1",
+        "output_col_name": "col1+",
+        "output_col_idx": "col2",
+    }, ["col0", "col1", "col1+", "col2", "col3"]),
+])
+def test_input_output_convertor(params, expected_header):
     """
     InputOutputConverter のテスト。
 
-    出力列名を指定し、出力先を指定しない場合は、
-    新規列を最後尾に追加する。
+    出力列名と出力位置の指定に応じて、
+    変換結果の列が正しい位置に出力されることを確認する。
     """
-    data = (
-        "col0,col1,col2,col3\n"
-        "00,01,02,03\n"
-        "10,11,12,13\n"
-        "20,21,22,23\n")
-    table = Table(data=data).convert(
+    table = Table(data=_INPUT_OUTPUT_DATA).convert(
         convertor="round",
-        params={
-            "input_col_idx": "col1",
-            "output_col_name": "col1+",
-            "overwrite": False,
-        })
-
-    with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 5
-            if lineno == 0:
-                assert row == ["col0", "col1", "col2", "col3", "col1+"]
-
-
-def test_input_output_convertor5():
-    """
-    InputOutputConverter のテスト。
-
-    出力列名も出力先も指定した場合は、
-    新規列を指定した位置に挿入する。
-    """
-    data = (
-        "col0,col1,col2,col3\n"
-        "00,01,02,03\n"
-        "10,11,12,13\n"
-        "20,21,22,23\n")
-    table = Table(data=data).convert(
-        convertor="round",
-        params={
-            "input_col_idx": "col1",
-            "output_col_name": "col1+",
-            "output_col_idx": "col2",
-        })
+        params=params)
 
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == 5
-            if lineno == 0:
-                assert row == ["col0", "col1", "col1+", "col2", "col3"]
+        assert next(reader) == expected_header
+        assert all(len(row) == len(expected_header) for row in reader)
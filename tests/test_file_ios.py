@@ -1,52 +1,65 @@
 import csv
+import gc
 import io
+import math
+import os
 from pathlib import Path
 import tempfile
 
 import pytest
 
 from tablelinker import Table
+from tablelinker.core.output import CsvOutputCollection
 
 sample_dir = Path(__file__).parent.parent / "sample/datafiles"
+# シート指定を変えて何度も開く Excel ファイル
+_HACHIJO_SIGHTSEEING_XLSX = sample_dir / "hachijo_sightseeing.xlsx"
+
+# hachijo_sightseeing.xlsx の見出し行
+_HACHIJO_SIGHTSEEING_HEADERS = [
+    "観光スポット名称", "所在地", "緯度", "経度", "座標系", "説明",
+    "八丈町ホームページ記載"]
+# yanai_tourism_sjis.csv, yanai_tourism_tsv.txt の見出し行
+_YANAI_TOURISM_HEADERS = [
+    "市区町村コード", "NO", "都道府県名", "市区町村名", "名称", "名称_カナ",
+    "名称_英語", "POIコード", "住所", "方書", "緯度", "経度", "利用可能曜日",
+    "開始時間", "終了時間", "利用可能日時特記事項", "料金(基本)",
+    "料金(詳細)", "説明", "説明_英語", "アクセス方法", "駐車場情報",
+    "バリアフリー情報", "連絡先名称", "連絡先電話番号", "連絡先内線番号",
+    "画像", "画像_ライセンス", "URL", "備考"]
 
 
 def test_excel_open():
     # シート名を指定せずに Excel ファイルを開くと
     # 最初のシートが開く
     table = Table(
-        file=sample_dir / "hachijo_sightseeing.xlsx",
+        file=_HACHIJO_SIGHTSEEING_XLSX,
         sheet=None)
     with table.open() as reader:
         for row in reader:
-            assert ",".join(row) == (
-                "観光スポット名称,所在地,緯度,経度,座標系,"
-                "説明,八丈町ホームページ記載"
-            )
+            assert row == _HACHIJO_SIGHTSEEING_HEADERS
             break
 
     # 存在しないシート名を指定して Excel ファイルを開くと
     # ValueError
     table = Table(
-        file=sample_dir / "hachijo_sightseeing.xlsx",
+        file=_HACHIJO_SIGHTSEEING_XLSX,
         sheet="その他")
     with pytest.raises(ValueError):
         table.open()
 
     # 存在するシート名を指定して Excel ファイルを開く
     table = Table(
-        file=sample_dir / "hachijo_sightseeing.xlsx",
+        file=_HACHIJO_SIGHTSEEING_XLSX,
         sheet="観光スポット")
     with table.open() as reader:
         for row in reader:
-            assert ",".join(row) == (
-                "観光スポット名称,所在地,緯度,経度,座標系,"
-                "説明,八丈町ホームページ記載"
-            )
+            assert row == _HACHIJO_SIGHTSEEING_HEADERS
             break
 
 
-def test_excel_save():
-    table = Table(sample_dir / "hachijo_sightseeing.xlsx")
+def test_excel_save(hachijo_sightseeing_xlsx_table):
+    table = hachijo_sightseeing_xlsx_table
 
     with tempfile.TemporaryDirectory() as tmpdir:
         temppath = Path(tmpdir) / "tmpfile.csv"
@@ -54,38 +67,28 @@ def test_excel_save():
 
         with open(temppath, "r", newline="") as f:
             reader = csv.reader(f)
-            for lineno, row in enumerate(reader):
-                assert len(row) == 7
-                if lineno == 0:
-                    assert ",".join(row) == (
-                        "観光スポット名称,所在地,緯度,経度,座標系,"
-                        "説明,八丈町ホームページ記載"
-                    )
+            header = next(reader)
+            assert header == _HACHIJO_SIGHTSEEING_HEADERS
+            assert all(len(row) == 7 for row in reader)
 
 
-def test_excel_write():
-    table = Table(sample_dir / "hachijo_sightseeing.xlsx")
+def test_excel_write(hachijo_sightseeing_xlsx_table):
+    table = hachijo_sightseeing_xlsx_table
 
     # write() の出力をテキストバッファに保存
     buf = io.StringIO()
     table.write(lines=5, file=buf)
 
-    # バッファの内容を csv reader で読み込んで検証
-    with io.StringIO(buf.getvalue()) as f:
-        reader = csv.reader(f)
-        for lineno, row in enumerate(reader):
-            assert len(row) == 7
-            if lineno == 0:
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,緯度,経度,座標系,"
-                    "説明,八丈町ホームページ記載"
-                )
-
-            assert lineno < 5
+    # バッファを先頭に戻し、 csv reader で読み込んで検証
+    buf.seek(0)
+    rows = list(csv.reader(buf))
+    assert rows[0] == _HACHIJO_SIGHTSEEING_HEADERS
+    assert all(len(row) == 7 for row in rows)
+    assert len(rows) <= 5
 
 
-def test_excel_convert():
-    table = Table(sample_dir / "hachijo_sightseeing.xlsx")
+def test_excel_convert(hachijo_sightseeing_xlsx_table):
+    table = hachijo_sightseeing_xlsx_table
     table = table.convert(
         convertor="move_col",
         params={
@@ -94,40 +97,33 @@ def test_excel_convert():
     )
 
     with table.open() as csv:
-        for lineno, row in enumerate(csv):
-            assert len(row) == 7
-            if lineno == 0:
-                # ヘッダ「座標系」が最後尾に移動していることを確認
-                assert ",".join(row) == (
-                    "観光スポット名称,所在地,緯度,経度,"
-                    "説明,八丈町ホームページ記載,座標系")
+        # ヘッダ「座標系」が最後尾に移動していることを確認
+        header = next(csv)
+        assert header == [
+            "観光スポット名称", "所在地", "緯度", "経度", "説明",
+            "八丈町ホームページ記載", "座標系"]
+
+        # レコードから座標系列が削除されていることを確認
+        row = next(csv)
+        assert len(row) == 7
+        assert row[0:4] == ["ホタル水路", "", "33.108218", "139.80102"]
+        assert row[4].startswith("八丈島は伊豆諸島で唯一、")
+        assert row[5] == (
+            "http://www.town.hachijo.tokyo.jp/kankou_spot/"
+            "mitsune.html#01")
 
-            elif lineno == 1:
-                # レコードから座標系列が削除されていることを確認
-                assert ",".join(row[0:4]) == "ホタル水路,,33.108218,139.80102"
-                assert row[4].startswith("八丈島は伊豆諸島で唯一、")
-                assert row[5] == (
-                    "http://www.town.hachijo.tokyo.jp/kankou_spot/"
-                    "mitsune.html#01")
+        assert all(len(row) == 7 for row in csv)
 
 
-def test_read_sjis():
+def test_read_sjis(yanai_tourism_sjis_table):
     """
     シフトJIS CSV ファイルを読み込めることを確認。
     """
-    table = Table(sample_dir / "yanai_tourism_sjis.csv")
-    correct_headers = (
-        "市区町村コード,NO,都道府県名,市区町村名,名称,名称_カナ,名称_英語,"
-        "POIコード,住所,方書,緯度,経度,利用可能曜日,開始時間,終了時間,"
-        "利用可能日時特記事項,料金(基本),料金(詳細),説明,説明_英語,"
-        "アクセス方法,駐車場情報,バリアフリー情報,連絡先名称,連絡先電話番号,"
-        "連絡先内線番号,画像,画像_ライセンス,URL,備考"
-    )
+    table = yanai_tourism_sjis_table
+    correct_headers = _YANAI_TOURISM_HEADERS
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == len(correct_headers.split(","))
-            if lineno == 0:
-                assert ",".join(row) == correct_headers
+        assert next(reader) == correct_headers
+        assert all(len(row) == len(correct_headers) for row in reader)
 
 
 def test_read_tsv():
@@ -135,18 +131,10 @@ def test_read_tsv():
     タブ区切り CSV ファイルを読めることを確認。
     """
     table = Table(sample_dir / "yanai_tourism_tsv.txt")
-    correct_headers = (
-        "市区町村コード,NO,都道府県名,市区町村名,名称,名称_カナ,名称_英語,"
-        "POIコード,住所,方書,緯度,経度,利用可能曜日,開始時間,終了時間,"
-        "利用可能日時特記事項,料金(基本),料金(詳細),説明,説明_英語,"
-        "アクセス方法,駐車場情報,バリアフリー情報,連絡先名称,連絡先電話番号,"
-        "連絡先内線番号,画像,画像_ライセンス,URL,備考"
-    )
+    correct_headers = _YANAI_TOURISM_HEADERS
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == len(correct_headers.split(","))
-            if lineno == 0:
-                assert ",".join(row) == correct_headers
+        assert next(reader) == correct_headers
+        assert all(len(row) == len(correct_headers) for row in reader)
 
 
 def test_skip_csv_comments():
@@ -154,14 +142,12 @@ def test_skip_csv_comments():
     CSV ファイルのコメント行を正しくスキップできることを確認。
     """
     table = Table(sample_dir / "kyotenbyoinlist20220101.csv")
-    correct_headers = (
-        "二次保健医療圏,,施設名,所在地,電話番号,病床数,三次\n救急"
-    )
+    correct_headers = [
+        "二次保健医療圏", "", "施設名", "所在地", "電話番号", "病床数",
+        "三次\n救急"]
     with table.open() as reader:
-        for lineno, row in enumerate(reader):
-            assert len(row) == len(correct_headers.split(","))
-            if lineno == 0:
-                assert ",".join(row) == correct_headers
+        assert next(reader) == correct_headers
+        assert all(len(row) == len(correct_headers) for row in reader)
 
 
 def test_datatype_adjustment():
@@ -179,15 +165,227 @@ def test_datatype_adjustment():
                 assert row[37] == "-"  # 文字列はそのまま
 
 
-def test_datatype_adjustment_dict():
+def test_datatype_adjustment_dict(yanai_tourism_sjis_table):
     """
     CSV ファイルのデータ型を dict リーダーでも
     正しく判定できていることを確認。
     """
-    table = Table(sample_dir / "yanai_tourism_sjis.csv")
+    table = yanai_tourism_sjis_table
     with table.open(as_dict=True, adjust_datatype=True) as dictreader:
-        for lineno, row in enumerate(dictreader):
+        row = next(dictreader)
+        assert len(row) == 30
+        for row in dictreader:
             assert len(row) == 30
-            if lineno > 0:
-                assert isinstance(row["緯度"], float) or row["緯度"] == ""
-                assert isinstance(row["経度"], float) or row["経度"] == ""
+            assert isinstance(row["緯度"], float) or row["緯度"] == ""
+            assert isinstance(row["経度"], float) or row["経度"] == ""
+
+
+def test_from_pandas_reopen():
+    """
+    DataFrame から作成した Table を繰り返し開けることを確認。
+    """
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({
+        "国名": ["アメリカ合衆国", "日本"],
+        "3文字コード": ["USA", "JPN"],
+    })
+    table = Table.fromPandas(df)
+    for _ in range(2):
+        with table.open() as reader:
+            rows = list(reader)
+
+        assert rows == [
+            ["国名", "3文字コード"],
+            ["アメリカ合衆国", "USA"],
+            ["日本", "JPN"],
+        ]
+
+
+def test_from_pandas_reopen_without_close():
+    """
+    DataFrame から作成した Table を、閉じずに開き直せることを確認。
+    """
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    table = Table.fromPandas(df)
+    assert list(table.open(as_dict=True)) == [
+        {"a": "1", "b": "x"},
+        {"a": "2", "b": "y"},
+    ]
+    assert list(table.open(adjust_datatype=True)) == [
+        ["a", "b"],
+        [1, "x"],
+        [2, "y"],
+    ]
+    table.close()
+
+
+def test_convert_tempfile_not_reused():
+    """
+    変換結果の一時ファイルが、解放後も他の Table に再利用されないことを確認。
+    """
+    table = Table(data="a,b\n1,x\n2,y\n", skip_cleaning=True)
+    params = {"input_col_idx": "a", "output_col_name": "c"}
+    kept = table.convert(convertor="rename_col", params=params)
+    released = table.convert(convertor="rename_col", params=params)
+    released_path = released.file
+    del released
+    gc.collect()
+    assert not os.path.exists(released_path)
+
+    # 新しい一時ファイルが作られ、残っている Table の内容は変わらない
+    converted = table.convert(convertor="rename_col", params=params)
+    assert os.path.basename(converted.file).startswith("table_")
+    assert converted.file not in (kept.file, released_path)
+    with kept.open() as reader:
+        assert list(reader) == [["c", "b"], ["1", "x"], ["2", "y"]]
+
+
+def test_save_escape_encoding_warnings(caplog):
+    """
+    エンコーディングエラーの警告が、保存するたびに出力されることを確認。
+    """
+    table = Table(data="a\n" + "🍣\n" * 12, skip_cleaning=True)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for _ in range(2):
+            caplog.clear()
+            table.save(Path(tmpdir) / "sjis.csv", encoding="cp932")
+            # 最初の 10 件の警告と、省略する旨の警告
+            assert len(caplog.records) == 11
+
+
+def test_save_skip_cleaning_uses_csv_writer():
+    """
+    クリーニング不要な CSV も csv.writer で書き出されることを確認。
+    """
+    table = Table(data='a,b\n1,"x"\n', skip_cleaning=True)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "saved.csv"
+        table.save(path)
+        assert path.read_bytes() == b"a,b\r\n1,x\r\n"
+
+
+def test_datatype_adjustment_int_float_forms():
+    """
+    int(), float() で変換できる表記が数値に変換されることを確認。
+    """
+    data = "a,b\n1,1.5\n2,2.5\n3,3.5\n 12,1e5\n1_000,-1.5e3\n-4,nan\n"
+    table = Table(data=data, skip_cleaning=True)
+    with table.open(adjust_datatype=True) as reader:
+        rows = list(reader)
+
+    assert [row[0] for row in rows[4:]] == [12, 1000, -4]
+    assert rows[4][1] == 100000.0
+    assert rows[5][1] == -1500.0
+    assert math.isnan(rows[6][1])
+
+
+def test_merge_into_from_pandas():
+    """
+    DataFrame から作成した Table を結合先にできることを確認。
+    """
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    table_dst = Table.fromPandas(df)
+    table_src = Table(data="b,a\nz,3\n", skip_cleaning=True)
+    table_src.merge(table_dst)
+    with table_dst.open() as reader:
+        rows = list(reader)
+
+    assert rows == [["a", "b"], ["1", "x"], ["2", "y"], ["3", "z"]]
+
+
+def test_to_pandas_skip_empty_rows():
+    """
+    toPandas() が空行を読み飛ばすことを確認。
+    """
+    pytest.importorskip("pandas")
+    table = Table(data="a,b\n1,x\n\n2,y\n", skip_cleaning=True)
+    df = table.toPandas()
+    assert df.columns.tolist() == ["a", "b"]
+    assert df.values.tolist() == [[1, "x"], [2, "y"]]
+
+
+def test_to_pandas_extra_cells():
+    """
+    見出しより多いセルが None 列にまとめられることを確認。
+    """
+    pytest.importorskip("pandas")
+    table = Table(data="a,b\n1,x\n2,y,z,w\n3\n", skip_cleaning=True)
+    df = table.toPandas()
+    assert df.columns.tolist() == ["a", "b", None]
+    assert df.values.tolist() == [
+        [1, "x", None],
+        [2, "y", ["z", "w"]],
+        [3, None, None],
+    ]
+
+
+def test_close_after_stream_closed():
+    """
+    呼び出し側でストリームを閉じた後でも Table を閉じられることを確認。
+    """
+    for buf in (io.BytesIO(b"a,b\n1,x\n"), io.StringIO("a,b\n1,x\n")):
+        table = Table(buf, skip_cleaning=True)
+        with table.open() as reader:
+            assert list(reader) == [["a", "b"], ["1", "x"]]
+            buf.close()
+
+        table.close()
+        del table
+
+
+def test_header_cache_cleared_on_open(tmp_path):
+    """
+    ファイルを書き換えて開き直すと見出し行が読み直されることを確認。
+    """
+    path = tmp_path / "header.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    table = Table(path, skip_cleaning=True)
+    assert table._get_header() == ["a", "b"]
+
+    path.write_text("c,d\n1,2\n", encoding="utf-8")
+    with table.open() as reader:
+        assert reader.__next__() == ["c", "d"]
+
+    assert table._get_header() == ["c", "d"]
+
+
+def test_csv_output_append_then_mutate(tmp_path):
+    """
+    append() した行を後から変更しても出力が変わらないことを確認。
+    """
+    path = tmp_path / "output.csv"
+    row = ["a", "b"]
+    with CsvOutputCollection(path) as output:
+        output.append(row)
+        row[0] = "c"
+        output.append(row)
+
+    with open(path, newline="") as f:
+        assert list(csv.reader(f)) == [["a", "b"], ["c", "b"]]
+
+
+def test_excel_skip_empty_rows_and_dedup_header(tmp_path):
+    """
+    Excel の空行を読み飛ばし、重複する見出しを区別することを確認。
+    """
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "dup.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["a", "a", "a.1", "b", "a"])
+    ws.append([1, 2, 3, 4, 5])
+    ws.append([])
+    ws.append([None, None])
+    ws.append([6, 7])
+    wb.save(path)
+
+    with Table(path).open() as reader:
+        rows = list(reader)
+
+    assert rows == [
+        ["a", "a.2", "a.1", "b", "a.3"],
+        ["1", "2", "3", "4", "5"],
+        ["6", "7", "", "", ""],
+    ]
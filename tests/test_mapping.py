@@ -0,0 +1,36 @@
+import pytest
+
+from tablelinker import Table
+from tablelinker.core.mapping import ItemsPair
+
+
+@pytest.mark.parametrize("items0, items1", [
+    ([], ["名称", "住所"]),
+    (["名称", "住所"], []),
+    ([], []),
+])
+def test_weighted_matrix_empty_items(items0, items1):
+    """
+    一方の見出しリストが空でも類似度行列を計算できることを確認。
+    """
+    mxsim, mxed = ItemsPair(items0, items1).get_weighted_matrix()
+    dim = max(len(items0), len(items1))
+    assert mxsim.shape == (dim, dim)
+    assert mxed.shape == (dim, dim)
+    assert not mxsim.any()
+    assert not mxed.any()
+
+
+def test_identical_items_skip_preload(monkeypatch):
+    """
+    見出しが完全に一致する場合はモデルを読み込まないことを確認。
+    """
+    def preload():
+        raise AssertionError("preload() が呼ばれました")
+
+    monkeypatch.setattr(ItemsPair, "preload", preload)
+    table = Table(data="名称,住所\n", skip_cleaning=True)
+    assert table.mapping_with_headers(["名称", "住所"]) == {
+        "名称": "名称",
+        "住所": "住所",
+    }
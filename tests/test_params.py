@@ -0,0 +1,68 @@
+import pytest
+
+from tablelinker.core.context import Context
+from tablelinker.core.convertors import convertor_find_by
+from tablelinker.core.params import (
+    AttributeParam, InputAttributeParam, Param)
+
+
+@pytest.mark.parametrize("val, expected", [
+    ("12", 12.0),
+    ("1,234.5", 1234.5),
+    ("-0.5", -0.5),
+])
+def test_eval_number(val, expected):
+    assert Param.eval_number(val) == expected
+
+
+@pytest.mark.parametrize("val", ["1e5", "-1.5E3", "abc", ""])
+def test_eval_number_invalid(val):
+    # 指数表記は数値として受け付けない
+    with pytest.raises(ValueError):
+        Param.eval_number(val)
+
+
+def test_arguments_copy():
+    """
+    arguments を変更しても次に取得する値に影響しないことを確認。
+    """
+    param = AttributeParam("input_col_idx", empty=True)
+    arguments = param.arguments
+    arguments["empty"] = False
+    arguments["extra"] = 1
+    assert param.arguments["empty"] is True
+    assert "extra" not in param.arguments
+
+
+def test_validators_reassigned():
+    """
+    validators を差し替えると検証に反映されることを確認。
+    """
+    def always_error(value, errors, input=None, output=None):
+        errors.append("error")
+        return False
+
+    param = Param("value")
+    errors = []
+    assert param.validate("1", errors) is True
+
+    param.validators = (always_error,)
+    assert param.validate("1", errors) is False
+    assert errors == ["error"]
+
+
+def test_attribute_index_after_headers_edited():
+    """
+    見出し行をその場で書き換えても正しい列番号を返すことを確認。
+    """
+    context = Context(
+        convertor=convertor_find_by("rename_col"),
+        convertor_params={"input_col_idx": "住所", "output_col_name": "所在地"},
+        input=None, output=None)
+    headers = ["名称", "住所"]
+    context.set_data("headers", headers)
+    param = InputAttributeParam("input_col_idx")
+    assert param.get_value("住所", context) == 1
+
+    headers.insert(0, "NO")
+    assert param.get_value("住所", context) == 2